@@ -3,8 +3,10 @@
 from .calculator import AnalyticalEngine
 from .insights import Insight, InsightEngine, InsightThresholds, Severity
 from .models import (
+    AnalysisResults,
     Anomaly,
     AnomalyReport,
+    AnomalyTable,
     CampaignKPIs,
     DayOfWeekStats,
     DeliveryPattern,
@@ -15,14 +17,18 @@ from .models import (
     PerformanceGap,
     PlatformPerformance,
     TemporalStats,
+    TemporalStatsSoA,
     WeeklyStats,
     WeekOverWeekChange,
+    WeekOverWeekTable,
 )
 
 __all__ = [
+    "AnalysisResults",
     "AnalyticalEngine",
     "Anomaly",
     "AnomalyReport",
+    "AnomalyTable",
     "CampaignKPIs",
     "DayOfWeekStats",
     "DeliveryPattern",
@@ -37,6 +43,8 @@ __all__ = [
     "PlatformPerformance",
     "Severity",
     "TemporalStats",
+    "TemporalStatsSoA",
     "WeeklyStats",
     "WeekOverWeekChange",
+    "WeekOverWeekTable",
 ]
@@ -1,30 +1,37 @@
 """Analytical Engine - main calculator class for ad campaign data analysis."""
 
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+from typing import Any, TypeVar
 
+import numpy as np
 import polars as pl
 
 from ..models.stat_pack import StatPack
 from .expressions import (
-    anomaly_direction_expr,
-    anomaly_flag_expr,
     campaign_kpi_expr,
     ctr_vs_avg_expr,
     day_of_week_aggregates_expr,
     domain_aggregates_expr,
     impression_share_expr,
+    pct_expr,
+    pearson_corr_expr,
     platform_aggregates_expr,
     spend_pct_of_total_expr,
     vcr_percentile_expr,
     weekly_totals_expr,
+    weekend_lift_expr,
     weekend_weekday_ctr_expr,
     wow_change_expr,
-    z_score_expr,
 )
 from .models import (
-    Anomaly,
+    AnalysisResults,
     AnomalyReport,
+    AnomalyTable,
     CampaignKPIs,
     DayOfWeekStats,
     DeliveryPattern,
@@ -35,54 +42,207 @@ from .models import (
     PerformanceGap,
     PlatformPerformance,
     TemporalStats,
-    WeeklyStats,
-    WeekOverWeekChange,
+    TemporalStatsSoA,
+    WeekOverWeekTable,
 )
 from .stats import detect_trend, pearson_correlation, weekend_lift
 
+_T = TypeVar("_T")
 
-@dataclass
+
+class _LFUCache:
+    """Bounded, thread-safe least-frequently-used cache.
+
+    When full, the entry with the fewest hits is evicted (the oldest one on
+    ties). Values are built outside the lock, so a slow build does not block
+    lookups of other keys.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._values: dict[Hashable, Any] = {}
+        self._hits: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], _T]) -> _T:
+        """Return the cached value for key, building and storing it on a miss."""
+        with self._lock:
+            if key in self._values:
+                self._hits[key] += 1
+                return self._values[key]
+
+        value = build()
+
+        with self._lock:
+            if key in self._values:  # Built concurrently; keep the first
+                return self._values[key]
+            if len(self._values) >= self.maxsize:
+                victim = min(self._hits, key=self._hits.__getitem__)
+                del self._values[victim], self._hits[victim]
+            self._values[key] = value
+            self._hits[key] = 1
+        return value
+
+
+def _resolvable(query: pl.LazyFrame) -> bool:
+    """Whether a lazy query's columns all exist in its input."""
+    try:
+        query.collect_schema()
+    except pl.exceptions.ColumnNotFoundError:
+        return False
+    return True
+
+
+@dataclass(frozen=True, eq=False)
 class AnalyticalEngine:
     """Main analytics calculator for ad campaign data.
 
     All methods are pure functions - they do not mutate the input DataFrame.
+    The engine is frozen, so its memoized results always match the
+    thresholds and goal it was built with; build a new engine to change them.
 
     Attributes:
-        df: Cleaned and enriched Polars DataFrame from ingestion pipeline
+        df: Cleaned and enriched Polars DataFrame from ingestion pipeline. A
+            LazyFrame (e.g. from DataIngestionPipeline.scan) is also accepted
+            and collected once, on construction.
         campaign_goal: Target impressions for the campaign (optional)
         anomaly_threshold: Z-score threshold for anomaly detection (default 1.5)
         spike_threshold: WoW change threshold for spike detection (default 0.50)
         backload_threshold: Threshold for back-loaded delivery (default 0.40)
     """
 
-    df: pl.DataFrame
+    df: pl.DataFrame | pl.LazyFrame
     campaign_goal: int | None = None
     anomaly_threshold: float = 1.5
     spike_threshold: float = 0.50
     backload_threshold: float = 0.40
 
+    # Aggregate frames materialized by collect_all(), keyed by query name
+    _frames: dict[str, pl.DataFrame] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Memoized analysis results, keyed by (method name, *args)
+    _results: _LFUCache = field(
+        default_factory=_LFUCache, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate input DataFrame has required columns."""
         required = {"impressions", "clicks", "spend", "ctr", "week_start", "report_day"}
-        available = set(self.df.columns)
+        available = set(self.df.collect_schema().names())
         missing = required - available
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
 
+        # Materialize lazy input once; every analysis reads the same rows
+        if isinstance(self.df, pl.LazyFrame):
+            object.__setattr__(self, "df", self.df.collect())
+
+    # =========================================================================
+    # BATCHED AGGREGATION
+    # =========================================================================
+
+    @cached_property
+    def total_impressions(self) -> int:
+        """Total impressions across the whole frame, computed once."""
+        return self.df["impressions"].sum()
+
+    def _lazy_frames(self) -> dict[str, pl.LazyFrame]:
+        """Lazy queries behind the engine's aggregate frames, by name."""
+        lf = self.df.lazy()
+        return {
+            "kpis": lf.select(campaign_kpi_expr()),
+            "weekly": lf.group_by("week_start")
+            .agg(weekly_totals_expr())
+            .sort("week_start"),
+            "dow": lf.group_by("day_of_week").agg(day_of_week_aggregates_expr()),
+            "domain": lf.group_by("domain").agg(
+                domain_aggregates_expr() + weekend_weekday_ctr_expr()
+            ),
+            "platform": lf.group_by("platform_device_type").agg(
+                platform_aggregates_expr()
+            ),
+            "daily": lf.group_by("report_day")
+            .agg(pl.col("impressions").sum().alias("daily_impressions"))
+            .sort("report_day"),
+            "weekly_ctr": lf.group_by("week_start")
+            .agg(pl.col("ctr").mean().alias("avg_ctr"))
+            .sort("week_start"),
+        }
+
+    def collect_all(self, names: Iterable[str] | None = None) -> None:
+        """Materialize aggregate frames in a single ``pl.collect_all`` batch.
+
+        Polars runs the queries in parallel over the shared input. Results are
+        memoized, so later get_* calls reuse them instead of re-scanning.
+
+        Args:
+            names: Query names to collect (default: all of them). Frames that
+                are already materialized are skipped. When collecting all,
+                queries over optional columns the frame lacks are skipped too.
+        """
+        wanted = None if names is None else set(names)
+        pending = {
+            name: query
+            for name, query in self._lazy_frames().items()
+            if name not in self._frames
+            and (name in wanted if wanted is not None else _resolvable(query))
+        }
+        if pending:
+            self._frames.update(zip(pending, pl.collect_all(list(pending.values()))))
+
+    def _frame(self, name: str) -> pl.DataFrame:
+        """Memoized aggregate frame, collected on first use."""
+        if name not in self._frames:
+            self.collect_all((name,))
+        return self._frames[name]
+
+    def _memo(self, key: tuple[Any, ...], build: Callable[[], _T]) -> _T:
+        """Return the memoized result for key, building it on first use."""
+        return self._results.get_or_build(key, build)
+
+    def compute_all(self) -> AnalysisResults:
+        """Run every analysis off one batched aggregation pass.
+
+        All aggregate frames are collected together first (see collect_all),
+        then each analysis reads them. Results are memoized, so the individual
+        get_* methods return the same objects afterwards.
+
+        Returns:
+            AnalysisResults with temporal, efficiency, CTR anomaly, delivery
+            and stat pack results.
+        """
+        self.collect_all()
+        return AnalysisResults(
+            temporal=self.get_temporal_stats(),
+            efficiency=self.get_efficiency_metrics(),
+            anomalies=self.detect_anomalies("ctr"),
+            delivery=self.get_delivery_pattern(),
+            stat_pack=self.get_stat_pack(),
+        )
+
     # =========================================================================
     # TEMPORAL ANALYSIS
     # =========================================================================
 
+    def get_weekly_totals_df(self) -> pl.DataFrame:
+        """Weekly aggregate metrics as a DataFrame, sorted by week_start.
+
+        Columns are those of weekly_totals_expr() plus week_start.
+        """
+        return self._frame("weekly")
+
     def get_temporal_stats(self) -> TemporalStats:
         """Calculate weekly aggregates and week-over-week changes.
 
         Returns:
             TemporalStats containing weekly totals, WoW deltas, and spikes.
         """
-        # Weekly totals
-        weekly_df = (
-            self.df.group_by("week_start").agg(weekly_totals_expr()).sort("week_start")
-        )
+        return self._memo(("temporal",), self._get_temporal_stats)
+
+    def _get_temporal_stats(self) -> TemporalStats:
+        """Uncached implementation of get_temporal_stats."""
+        weekly_df = self.get_weekly_totals_df()
 
         # Calculate WoW changes for key metrics
         metrics = ["total_impressions", "total_clicks", "total_spend", "avg_ctr"]
@@ -90,85 +250,99 @@ class AnalyticalEngine:
             [wow_change_expr(m) for m in metrics]
         )
 
-        # Build WeeklyStats objects
-        weekly_totals = [
-            WeeklyStats(
-                week_start=row["week_start"],
-                impressions=row["total_impressions"],
-                clicks=row["total_clicks"],
-                spend=row["total_spend"],
-                avg_ctr=row["avg_ctr"],
-                avg_cpm=row["avg_cpm"],
-                avg_vcr=row.get("avg_vcr"),
-                avg_viewability=row.get("avg_viewability"),
-            )
-            for row in weekly_df.to_dicts()
-        ]
+        # Weekly columns as arrays; WeeklyStats objects are derived from them
+        weekly_soa = TemporalStatsSoA(
+            week_start=weekly_df["week_start"].to_numpy(),
+            impressions=weekly_df["total_impressions"].to_numpy(),
+            clicks=weekly_df["total_clicks"].to_numpy(),
+            spend=weekly_df["total_spend"].to_numpy(),
+            avg_ctr=weekly_df["avg_ctr"].to_numpy(),
+            avg_cpm=weekly_df["avg_cpm"].to_numpy(),
+            avg_vcr=weekly_df["avg_vcr"].to_numpy(),
+            avg_viewability=weekly_df["avg_viewability"].to_numpy(),
+        )
+        weekly_totals = weekly_soa.as_aos()
 
-        # Extract WoW changes and detect spikes
-        wow_changes: list[WeekOverWeekChange] = []
-        for row in weekly_with_wow.to_dicts():
-            for metric in metrics:
-                change_col = f"{metric}_wow_change"
-                pct_change = row.get(change_col)
-                if pct_change is not None:
-                    current_val = row[metric]
-                    # Calculate previous value from change
-                    prev_val = (
-                        current_val / (1 + pct_change) if pct_change != -1 else 0
-                    )
-                    wow_changes.append(
-                        WeekOverWeekChange(
-                            week_start=row["week_start"],
-                            metric_name=metric,
-                            current_value=current_val,
-                            previous_value=prev_val,
-                            pct_change=pct_change,
-                            is_spike=abs(pct_change) >= self.spike_threshold,
-                        )
-                    )
+        # WoW changes for every metric as one long frame, week-major in
+        # metric order; the previous value is recovered from the change
+        wow_df = pl.concat(
+            [
+                weekly_with_wow.select(
+                    "week_start",
+                    pl.lit(metric).alias("metric_name"),
+                    pl.col(metric).cast(pl.Float64).alias("current_value"),
+                    pl.when(pl.col(f"{metric}_wow_change") != -1)
+                    .then(pl.col(metric) / (1 + pl.col(f"{metric}_wow_change")))
+                    .otherwise(0.0)
+                    .alias("previous_value"),
+                    pl.col(f"{metric}_wow_change").alias("pct_change"),
+                ).filter(pl.col("pct_change").is_not_null())
+                for metric in metrics
+            ]
+        ).sort("week_start", maintain_order=True)
+        # NaN changes (0/0 weeks) are kept but never spikes; Polars orders
+        # NaN above every number, so exclude it explicitly
+        wow_df = wow_df.with_columns(
+            (
+                (pl.col("pct_change").abs() >= self.spike_threshold)
+                & pl.col("pct_change").is_not_nan()
+            ).alias("is_spike")
+        )
 
-        spikes = [w for w in wow_changes if w.is_spike]
+        wow_changes = WeekOverWeekTable(wow_df)
+        spikes = WeekOverWeekTable(wow_df.filter(pl.col("is_spike")))
 
         return TemporalStats(
             weekly_totals=weekly_totals,
             wow_changes=wow_changes,
             spikes=spikes,
+            weekly_soa=weekly_soa,
         )
 
     # =========================================================================
     # EFFICIENCY METRICS
     # =========================================================================
 
+    def get_all_group_stats(self) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """Per-domain and per-platform aggregates, computed together once.
+
+        Returns:
+            Tuple of (domain_df, platform_df). domain_df has the columns of
+            domain_aggregates_expr() and weekend_weekday_ctr_expr();
+            platform_df those of platform_aggregates_expr().
+        """
+        self.collect_all(("domain", "platform"))
+        return self._frames["domain"], self._frames["platform"]
+
     def get_efficiency_metrics(self) -> EfficiencyMetrics:
         """Calculate domain and platform efficiency metrics.
 
         Returns:
             EfficiencyMetrics with domain rankings, correlations, and gaps.
         """
-        # Domain-level metrics
-        domain_df = self.df.group_by("domain").agg(domain_aggregates_expr())
+        return self._memo(("efficiency",), self._get_efficiency_metrics)
 
-        # Weekend vs weekday CTR by domain
-        weekend_weekday_df = self.df.group_by("domain").agg(weekend_weekday_ctr_expr())
+    def _get_efficiency_metrics(self) -> EfficiencyMetrics:
+        """Uncached implementation of get_efficiency_metrics."""
+        # Domain metrics (incl. weekend vs weekday CTR) and platform metrics
+        domain_df, platform_df = self.get_all_group_stats()
 
-        # Combine domain metrics
-        domain_combined = domain_df.join(weekend_weekday_df, on="domain")
-
-        domain_metrics: list[DomainEfficiency] = []
-        for row in domain_combined.to_dicts():
-            # Calculate CTR/VCR correlation for this domain
-            domain_data = self.df.filter(pl.col("domain") == row["domain"])
-            correlation = pearson_correlation(
-                domain_data, "ctr", "video_complete_pct", min_samples=5
+        # CTR/VCR correlation for every domain in one grouped pass
+        domain_correlations: dict[str, float | None] = {}
+        if "video_complete_pct" in self.df.columns:
+            domain_correlations = dict(
+                self.df.filter(
+                    pl.col("ctr").is_not_null()
+                    & pl.col("video_complete_pct").is_not_null()
+                )
+                .group_by("domain")
+                .agg(pearson_corr_expr("ctr", "video_complete_pct", min_samples=5))
+                .iter_rows()
             )
 
-            # Weekend lift
-            weekday_ctr = row.get("weekday_ctr")
-            weekend_ctr = row.get("weekend_ctr")
-            lift = None
-            if weekday_ctr and weekday_ctr > 0 and weekend_ctr is not None:
-                lift = (weekend_ctr - weekday_ctr) / weekday_ctr
+        domain_metrics: list[DomainEfficiency] = []
+        for row in domain_df.with_columns(weekend_lift_expr()).to_dicts():
+            correlation = domain_correlations.get(row["domain"])
 
             domain_metrics.append(
                 DomainEfficiency(
@@ -178,17 +352,12 @@ class AnalyticalEngine:
                     total_impressions=row["total_impressions"],
                     total_spend=row["total_spend"],
                     ctr_vcr_correlation=correlation,
-                    weekend_lift=lift,
-                    weekday_avg_ctr=weekday_ctr or 0,
-                    weekend_avg_ctr=weekend_ctr or 0,
+                    weekend_lift=row["weekend_lift"],
+                    weekday_avg_ctr=row["weekday_ctr"] or 0,
+                    weekend_avg_ctr=row["weekend_ctr"] or 0,
                 )
             )
 
-        # Platform-level metrics
-        platform_df = self.df.group_by("platform_device_type").agg(
-            platform_aggregates_expr()
-        )
-
         platform_metrics = [
             PlatformPerformance(
                 platform=row["platform_device_type"],
@@ -202,26 +371,28 @@ class AnalyticalEngine:
 
         # Performance gaps
         performance_gaps: list[PerformanceGap] = []
+        platforms = platform_df["platform_device_type"]
         for metric in ["avg_ctr", "total_impressions"]:
-            max_val = platform_df[metric].max()
-            min_val = platform_df[metric].min()
+            column = platform_df[metric]
+            max_val = column.max()
+            min_val = column.min()
 
             if max_val and max_val > 0:
-                max_rows = platform_df.filter(pl.col(metric) == max_val).to_dicts()
-                min_rows = platform_df.filter(pl.col(metric) == min_val).to_dicts()
-
-                if max_rows and min_rows:
-                    gap_pct = (max_val - min_val) / max_val
-                    performance_gaps.append(
-                        PerformanceGap(
-                            metric_name=metric,
-                            max_platform=max_rows[0]["platform_device_type"],
-                            max_value=max_val,
-                            min_platform=min_rows[0]["platform_device_type"],
-                            min_value=min_val,
-                            gap_pct=gap_pct,
-                        )
+                # Rows of the extremes (first on ties); nulls become NaN
+                values = column.cast(pl.Float64).to_numpy()
+                imax = int(np.nanargmax(values))
+                imin = int(np.nanargmin(values))
+                gap_pct = (max_val - min_val) / max_val
+                performance_gaps.append(
+                    PerformanceGap(
+                        metric_name=metric,
+                        max_platform=platforms[imax],
+                        max_value=max_val,
+                        min_platform=platforms[imin],
+                        min_value=min_val,
+                        gap_pct=gap_pct,
                     )
+                )
 
         # Overall correlations and weekend lift
         overall_correlation = pearson_correlation(
@@ -258,13 +429,40 @@ class AnalyticalEngine:
         Returns:
             AnomalyReport with flagged weeks and z-scores.
         """
-        # Aggregate metric by week
+        return self._memo(("anomalies", metric), lambda: self._detect_anomalies(metric))
+
+    def detect_anomalies_bulk(self, metrics: Iterable[str]) -> dict[str, AnomalyReport]:
+        """Detect anomalies for several metrics concurrently.
+
+        Each metric's weekly aggregation and z-score pass is independent, and
+        both run in Polars/NumPy with the GIL released, so the metrics are
+        spread over a thread pool.
+
+        Args:
+            metrics: Column names to analyze, e.g. ["ctr", "impressions"]
+
+        Returns:
+            AnomalyReport per metric, in the order given.
+        """
+        metrics = list(dict.fromkeys(metrics))
+        if "ctr" in metrics:
+            # Materialize the shared frame up front rather than from workers
+            self._frame("weekly_ctr")
+        with ThreadPoolExecutor(max_workers=min(len(metrics), 8) or 1) as pool:
+            return dict(zip(metrics, pool.map(self.detect_anomalies, metrics)))
+
+    def _detect_anomalies(self, metric: str) -> AnomalyReport:
+        """Uncached implementation of detect_anomalies."""
+        # Aggregate metric by week (CTR comes from the batched frames)
         agg_col = "avg_ctr" if metric == "ctr" else metric
-        weekly = (
-            self.df.group_by("week_start")
-            .agg(pl.col(metric).mean().alias(agg_col))
-            .sort("week_start")
-        )
+        if metric == "ctr":
+            weekly = self._frame("weekly_ctr")
+        else:
+            weekly = (
+                self.df.group_by("week_start")
+                .agg(pl.col(metric).mean().alias(agg_col))
+                .sort("week_start")
+            )
 
         # Calculate mean and std for z-score
         mean_val = weekly[agg_col].mean()
@@ -272,38 +470,33 @@ class AnalyticalEngine:
 
         if std_val is None or std_val == 0:
             return AnomalyReport(
-                anomalies=[],
+                anomalies=AnomalyTable.empty(),
                 threshold_used=self.anomaly_threshold,
                 total_weeks_analyzed=len(weekly),
             )
 
-        # Add z-score first, then anomaly flags (they depend on z-score column)
-        weekly_with_z = (
-            weekly.with_columns(z_score_expr(agg_col, mean_val, std_val))
-            .with_columns(
-                [
-                    anomaly_flag_expr(agg_col, self.anomaly_threshold),
-                    anomaly_direction_expr(agg_col),
-                ]
+        # Z-scores for all weeks in one vectorized step; the flagged weeks
+        # are kept as a frame and only become Anomaly objects on iteration
+        values = weekly[agg_col].to_numpy()
+        z_scores = (values - mean_val) / std_val
+        idx = np.flatnonzero(np.abs(z_scores) > self.anomaly_threshold)
+        flagged_z = z_scores[idx]
+
+        anomalies = AnomalyTable(
+            pl.DataFrame(
+                {
+                    "week_start": weekly["week_start"].gather(idx),
+                    "metric_name": [metric] * len(idx),
+                    "value": values[idx],
+                    "mean": np.full(len(idx), mean_val),
+                    "std": np.full(len(idx), std_val),
+                    "z_score": flagged_z,
+                    "direction": np.where(flagged_z > 0, "above", "below"),
+                },
+                schema=AnomalyTable.schema,
             )
         )
 
-        # Extract anomalies
-        anomalies: list[Anomaly] = []
-        anomaly_rows = weekly_with_z.filter(pl.col(f"{agg_col}_is_anomaly")).to_dicts()
-        for row in anomaly_rows:
-            anomalies.append(
-                Anomaly(
-                    week_start=row["week_start"],
-                    metric_name=metric,
-                    value=row[agg_col],
-                    mean=mean_val,
-                    std=std_val,
-                    z_score=row[f"{agg_col}_z_score"],
-                    direction=row[f"{agg_col}_anomaly_direction"],
-                )
-            )
-
         return AnomalyReport(
             anomalies=anomalies,
             threshold_used=self.anomaly_threshold,
@@ -386,7 +579,7 @@ class AnalyticalEngine:
         if self.campaign_goal is None:
             raise ValueError("campaign_goal must be set to calculate goal progress")
 
-        total_impressions = self.df["impressions"].sum()
+        total_impressions = self.total_impressions
         completion_pct = (total_impressions / self.campaign_goal) * 100
 
         # Calculate projected completion based on time elapsed
@@ -428,15 +621,16 @@ class AnalyticalEngine:
         Returns:
             DeliveryPattern with back-loading detection.
         """
-        # Daily impressions sorted by date
-        daily = (
-            self.df.group_by("report_day")
-            .agg(pl.col("impressions").sum().alias("daily_impressions"))
-            .sort("report_day")
-        )
+        return self._memo(("delivery",), self._get_delivery_pattern)
+
+    def _get_delivery_pattern(self) -> DeliveryPattern:
+        """Uncached implementation of get_delivery_pattern."""
+        # Daily impressions sorted by date, as one array shared by the
+        # back-loading share and the trend regression
+        daily = self._frame("daily")["daily_impressions"].to_numpy()
 
         total_days = len(daily)
-        total_impressions = daily["daily_impressions"].sum()
+        total_impressions = daily.sum() if total_days else 0
 
         if total_days == 0 or total_impressions == 0:
             return DeliveryPattern(
@@ -446,14 +640,12 @@ class AnalyticalEngine:
                 daily_trend="stable",
             )
 
-        # Get last 25% of days
+        # Share of impressions in the last 25% of days
         last_quarter_start = int(total_days * 0.75)
-        last_quarter_impressions = daily[last_quarter_start:]["daily_impressions"].sum()
-        last_quarter_pct = last_quarter_impressions / total_impressions
+        last_quarter_pct = float(daily[last_quarter_start:].sum() / total_impressions)
 
         # Detect trend
-        daily_values = daily["daily_impressions"].to_list()
-        trend = detect_trend(daily_values)
+        trend = detect_trend(daily)
 
         return DeliveryPattern(
             is_back_loaded=last_quarter_pct > self.backload_threshold,
@@ -475,7 +667,7 @@ class AnalyticalEngine:
             CampaignKPIs with impressions, clicks, spend, CTR, CPM,
             viewability, and VCR.
         """
-        kpis = self.df.select(campaign_kpi_expr()).to_dicts()[0]
+        kpis = self._frame("kpis").to_dicts()[0]
 
         return CampaignKPIs(
             total_impressions=kpis["total_impressions"],
@@ -507,10 +699,8 @@ class AnalyticalEngine:
             "Sunday",
         ]
 
-        dow_df = self.df.group_by("day_of_week").agg(day_of_week_aggregates_expr())
-
         # Sort by day of week order
-        dow_df = dow_df.with_columns(
+        dow_df = self._frame("dow").with_columns(
             pl.col("day_of_week")
             .replace_strict(dow_order, list(range(7)), default=7)
             .alias("dow_order")
@@ -548,10 +738,10 @@ class AnalyticalEngine:
         Returns:
             Tuple of (list of DomainStats sorted by impressions, top_n_share)
         """
-        total_impressions = self.df["impressions"].sum()
+        total_impressions = self.total_impressions
 
         # Get domain aggregates
-        domain_df = self.df.group_by("domain").agg(domain_aggregates_expr())
+        domain_df, _ = self.get_all_group_stats()
 
         # Add impression share
         domain_df = domain_df.with_columns(
@@ -594,17 +784,14 @@ class AnalyticalEngine:
 
         return domain_stats, top_n_share
 
-    def get_platform_stats(self) -> list[PlatformPerformance]:
-        """Calculate platform/device breakdown with impression share.
+    def get_platform_stats_df(self) -> pl.DataFrame:
+        """Platform/device aggregates with impression share as a DataFrame.
 
-        Returns:
-            List of PlatformPerformance with share calculations.
+        Sorted by total_impressions descending.
         """
-        total_impressions = self.df["impressions"].sum()
+        total_impressions = self.total_impressions
 
-        platform_df = self.df.group_by("platform_device_type").agg(
-            platform_aggregates_expr()
-        )
+        _, platform_df = self.get_all_group_stats()
 
         # Add impression share
         platform_df = platform_df.with_columns(
@@ -612,8 +799,14 @@ class AnalyticalEngine:
         )
 
         # Sort by impressions descending
-        platform_df = platform_df.sort("total_impressions", descending=True)
+        return platform_df.sort("total_impressions", descending=True)
+
+    def get_platform_stats(self) -> list[PlatformPerformance]:
+        """Calculate platform/device breakdown with impression share.
 
+        Returns:
+            List of PlatformPerformance with share calculations.
+        """
         return [
             PlatformPerformance(
                 platform=row["platform_device_type"],
@@ -622,7 +815,7 @@ class AnalyticalEngine:
                 total_impressions=row["total_impressions"],
                 total_spend=row["total_spend"],
             )
-            for row in platform_df.to_dicts()
+            for row in self.get_platform_stats_df().to_dicts()
         ]
 
     # =========================================================================
@@ -637,6 +830,10 @@ class AnalyticalEngine:
         Returns:
             StatPack with all aggregates, trends, and anomalies.
         """
+        return self._memo(("stat_pack",), self._get_stat_pack)
+
+    def _get_stat_pack(self) -> StatPack:
+        """Uncached implementation of get_stat_pack."""
         # Run all analyses
         temporal = self.get_temporal_stats()
         efficiency = self.get_efficiency_metrics()
@@ -655,7 +852,7 @@ class AnalyticalEngine:
             }
         else:
             goal_dict = {
-                "total": self.df["impressions"].sum(),
+                "total": self.total_impressions,
                 "goal": None,
                 "completion_pct": None,
                 "is_on_track": None,
@@ -690,41 +887,44 @@ class AnalyticalEngine:
             for w in temporal.weekly_totals
         ]
 
-        # Build WoW changes dicts
+        # Build WoW changes dicts, reading the table columns directly
+        # (pct_change is never null in the table)
+        wow_columns = ("week_start", "metric_name", "pct_change")
         wow_changes = [
             {
-                "week": w.week_start.isoformat(),
-                "metric": w.metric_name,
-                "pct_change": round(w.pct_change * 100, 2),  # as percentage
+                "week": week.isoformat(),
+                "metric": metric,
+                "pct_change": round(pct * 100, 2),  # as percentage
             }
-            for w in temporal.wow_changes
-            if w.pct_change is not None
+            for week, metric, pct in temporal.wow_changes.df.select(
+                wow_columns
+            ).iter_rows()
         ]
 
         # Build spikes dicts
         spikes = [
             {
-                "week": s.week_start.isoformat(),
-                "metric": s.metric_name,
-                "pct_change": round(s.pct_change * 100, 2),
-                "description": f"{abs(s.pct_change) * 100:.1f}% {'spike' if s.pct_change > 0 else 'drop'}",
+                "week": week.isoformat(),
+                "metric": metric,
+                "pct_change": round(pct * 100, 2),
+                "description": f"{abs(pct) * 100:.1f}% {'spike' if pct > 0 else 'drop'}",
             }
-            for s in temporal.spikes
+            for week, metric, pct in temporal.spikes.df.select(wow_columns).iter_rows()
         ]
 
-        # Domain rankings (sorted by CTR)
-        domain_rankings = [
-            {
-                "domain": d.domain,
-                "avg_ctr": round(d.avg_ctr * 100, 4),
-                "avg_vcr": round(d.avg_vcr * 100, 2) if d.avg_vcr else None,
-                "impressions": d.total_impressions,
-                "weekend_lift": round(d.weekend_lift * 100, 2) if d.weekend_lift else None,
-            }
-            for d in sorted(
-                efficiency.domain_metrics, key=lambda x: x.avg_ctr, reverse=True
+        # Domain rankings (sorted by CTR), kept as a frame so StatPack only
+        # turns the top/bottom slices into dicts
+        domain_rankings = (
+            self.get_all_group_stats()[0]
+            .sort("avg_ctr", descending=True)
+            .select(
+                "domain",
+                (pl.col("avg_ctr") * 100).round(4),
+                pct_expr("avg_vcr", 2),
+                pl.col("total_impressions").alias("impressions"),
+                pct_expr(weekend_lift_expr(), 2),
             )
-        ]
+        )
 
         # Platform comparison
         platform_comparison = [
@@ -802,7 +1002,7 @@ class AnalyticalEngine:
             campaign_id=self.df["campaign_id"].unique()[0],
             date_range=date_range,
             total_rows=len(self.df),
-            total_impressions=self.df["impressions"].sum(),
+            total_impressions=self.total_impressions,
             total_clicks=self.df["clicks"].sum(),
             total_spend=self.df["spend"].sum(),
             avg_ctr=self.df["ctr"].mean(),
@@ -139,6 +139,19 @@ def day_of_week_aggregates_expr() -> list[pl.Expr]:
     ]
 
 
+def pearson_corr_expr(col_x: str, col_y: str, min_samples: int = 10) -> pl.Expr:
+    """Pearson correlation of two columns as an aggregation.
+
+    Null when fewer than min_samples rows or either column is constant,
+    matching stats.pearson_correlation. Rows with a null in either column
+    must be filtered out beforehand.
+    """
+    x, y = pl.col(col_x), pl.col(col_y)
+    return pl.when(
+        (pl.len() >= min_samples) & (x.max() > x.min()) & (y.max() > y.min())
+    ).then(pl.corr(col_x, col_y))
+
+
 def weekend_weekday_ctr_expr() -> list[pl.Expr]:
     """Expressions for weekend vs weekday CTR comparison."""
     return [
@@ -147,30 +160,23 @@ def weekend_weekday_ctr_expr() -> list[pl.Expr]:
     ]
 
 
-# =============================================================================
-# ANOMALY DETECTION
-# =============================================================================
+def pct_expr(col: str | pl.Expr, digits: int) -> pl.Expr:
+    """Rate as a rounded percentage; null when zero or missing."""
+    expr = pl.col(col) if isinstance(col, str) else col
+    return pl.when(expr != 0).then((expr * 100).round(digits))
 
 
-def z_score_expr(metric: str, mean: float, std: float) -> pl.Expr:
-    """Calculate z-score for a metric given mean and std."""
-    if std == 0:
-        return pl.lit(0.0).alias(f"{metric}_z_score")
-    return ((pl.col(metric) - mean) / std).alias(f"{metric}_z_score")
+def weekend_lift_expr() -> pl.Expr:
+    """Relative weekend CTR lift over weekday CTR (null without a weekday baseline).
 
-
-def anomaly_flag_expr(metric: str, threshold: float = 1.5) -> pl.Expr:
-    """Flag rows where z-score exceeds threshold."""
-    z_col = f"{metric}_z_score"
-    return (pl.col(z_col).abs() > threshold).alias(f"{metric}_is_anomaly")
-
-
-def anomaly_direction_expr(metric: str) -> pl.Expr:
-    """Determine anomaly direction (above/below mean)."""
-    z_col = f"{metric}_z_score"
+    Expects the columns produced by weekend_weekday_ctr_expr().
+    """
+    weekend, weekday = pl.col("weekend_ctr"), pl.col("weekday_ctr")
     return (
-        pl.when(pl.col(z_col) > 0).then(pl.lit("above")).otherwise(pl.lit("below"))
-    ).alias(f"{metric}_anomaly_direction")
+        pl.when((weekday > 0) & weekend.is_not_null())
+        .then((weekend - weekday) / weekday)
+        .alias("weekend_lift")
+    )
 
 
 # =============================================================================
@@ -1,11 +1,20 @@
 """Output models for analytics calculations."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date
-from typing import Literal
+from itertools import starmap
+from typing import ClassVar, Generic, Literal, TypeVar
 
+import numpy as np
+import polars as pl
 
-@dataclass(frozen=True)
+from ..models.stat_pack import StatPack
+
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True, slots=True)
 class WeeklyStats:
     """Aggregated stats for a single week."""
 
@@ -19,7 +28,7 @@ class WeeklyStats:
     avg_viewability: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeekOverWeekChange:
     """WoW delta for a single metric."""
 
@@ -31,16 +40,102 @@ class WeekOverWeekChange:
     is_spike: bool  # abs(pct_change) > spike_threshold
 
 
+@dataclass(frozen=True, eq=False)
+class TemporalStatsSoA:
+    """Weekly totals as one NumPy array per metric (struct-of-arrays).
+
+    Lets plotting/serialization consume whole columns without walking
+    WeeklyStats objects attribute by attribute.
+    """
+
+    week_start: np.ndarray  # datetime64[D]
+    impressions: np.ndarray
+    clicks: np.ndarray
+    spend: np.ndarray
+    avg_ctr: np.ndarray
+    avg_cpm: np.ndarray
+    avg_vcr: np.ndarray
+    avg_viewability: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.week_start)
+
+    def as_aos(self) -> list[WeeklyStats]:
+        """Materialize the per-week WeeklyStats list."""
+        return [
+            WeeklyStats(*row)
+            for row in zip(
+                self.week_start.tolist(),
+                self.impressions.tolist(),
+                self.clicks.tolist(),
+                self.spend.tolist(),
+                self.avg_ctr.tolist(),
+                self.avg_cpm.tolist(),
+                self.avg_vcr.tolist(),
+                self.avg_viewability.tolist(),
+            )
+        ]
+
+
+@dataclass(frozen=True, eq=False)
+class _RowTable(Generic[_R]):
+    """Sequence of row dataclasses stored as a single DataFrame.
+
+    Rows are only turned into objects when iterated or indexed, so building
+    a table costs one frame rather than one allocation per row. The frame's
+    columns follow the field order of the row type.
+    """
+
+    row_type: ClassVar[type]
+    schema: ClassVar[dict[str, type[pl.DataType]]]
+
+    df: pl.DataFrame
+
+    @classmethod
+    def empty(cls) -> "_RowTable[_R]":
+        """Table with no rows."""
+        return cls(pl.DataFrame(schema=cls.schema))
+
+    def __len__(self) -> int:
+        return self.df.height
+
+    def __iter__(self) -> Iterator[_R]:
+        columns = (s.to_list() for s in self.df.get_columns())
+        return starmap(self.row_type, zip(*columns))
+
+    def __getitem__(self, index: int | slice) -> "_R | _RowTable[_R]":
+        """Row object for an int index, sub-table for a slice."""
+        if isinstance(index, slice):
+            return type(self)(self.df[index])
+        return self.row_type(*self.df.row(index))
+
+
+@dataclass(frozen=True, eq=False)
+class WeekOverWeekTable(_RowTable[WeekOverWeekChange]):
+    """WeekOverWeekChange rows as a DataFrame (see _RowTable)."""
+
+    row_type: ClassVar[type] = WeekOverWeekChange
+    schema: ClassVar[dict[str, type[pl.DataType]]] = {
+        "week_start": pl.Date,
+        "metric_name": pl.String,
+        "current_value": pl.Float64,
+        "previous_value": pl.Float64,
+        "pct_change": pl.Float64,
+        "is_spike": pl.Boolean,
+    }
+
+
 @dataclass(frozen=True)
 class TemporalStats:
     """Complete temporal analysis output."""
 
     weekly_totals: list[WeeklyStats]
-    wow_changes: list[WeekOverWeekChange]
-    spikes: list[WeekOverWeekChange]  # Filtered to is_spike=True
+    wow_changes: WeekOverWeekTable
+    spikes: WeekOverWeekTable  # Filtered to is_spike=True
+    weekly_soa: TemporalStatsSoA | None = None  # Same weeks, column layout
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEfficiency:
     """Efficiency metrics for a single domain."""
 
@@ -55,7 +150,7 @@ class DomainEfficiency:
     weekend_avg_ctr: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlatformPerformance:
     """Performance metrics by platform/device."""
 
@@ -66,7 +161,7 @@ class PlatformPerformance:
     total_spend: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PerformanceGap:
     """Gap between best and worst performers."""
 
@@ -89,7 +184,7 @@ class EfficiencyMetrics:
     overall_weekend_lift: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Anomaly:
     """Single anomaly detection result."""
 
@@ -102,16 +197,32 @@ class Anomaly:
     direction: Literal["above", "below"]
 
 
+@dataclass(frozen=True, eq=False)
+class AnomalyTable(_RowTable[Anomaly]):
+    """Anomaly rows as a DataFrame (see _RowTable)."""
+
+    row_type: ClassVar[type] = Anomaly
+    schema: ClassVar[dict[str, type[pl.DataType]]] = {
+        "week_start": pl.Date,
+        "metric_name": pl.String,
+        "value": pl.Float64,
+        "mean": pl.Float64,
+        "std": pl.Float64,
+        "z_score": pl.Float64,
+        "direction": pl.String,
+    }
+
+
 @dataclass(frozen=True)
 class AnomalyReport:
     """Complete anomaly detection output."""
 
-    anomalies: list[Anomaly]
+    anomalies: AnomalyTable
     threshold_used: float  # z-score threshold (default 1.5)
     total_weeks_analyzed: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoalProgress:
     """Campaign goal completion status."""
 
@@ -122,7 +233,7 @@ class GoalProgress:
     projected_completion_pct: float  # Based on time elapsed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeliveryPattern:
     """Delivery pattern analysis."""
 
@@ -145,7 +256,7 @@ class CampaignKPIs:
     vcr_pct: float | None  # weighted VCR
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DayOfWeekStats:
     """Performance metrics for a single day of week."""
 
@@ -157,7 +268,7 @@ class DayOfWeekStats:
     avg_vcr: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainStats:
     """Enhanced domain stats with share calculations."""
 
@@ -171,3 +282,14 @@ class DomainStats:
     avg_viewability: float | None
     impression_share: float  # domain_impressions / total_impressions
     is_underperforming: bool  # high share + low metrics
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResults:
+    """All engine analyses, as returned by AnalyticalEngine.compute_all()."""
+
+    temporal: TemporalStats
+    efficiency: EfficiencyMetrics
+    anomalies: AnomalyReport  # CTR anomalies
+    delivery: DeliveryPattern
+    stat_pack: StatPack
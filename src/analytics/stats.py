@@ -62,6 +62,11 @@ def detect_trend(
         return "stable"
 
     arr = np.array(values)
+
+    # Fast path: a constant series has no trend, so skip the regression
+    if (arr == arr[0]).all():
+        return "stable"
+
     x = np.arange(len(arr))
 
     slope, _, r_value, p_value, _ = stats.linregress(x, arr)
@@ -27,6 +27,19 @@ class DataValidationError(IngestionError):
         )
 
 
+class ColumnValidationError(DataValidationError):
+    """Column-level validation failed (missing column, wrong dtype or nulls)."""
+
+    def __init__(self, errors: list[dict[str, Any]], row_count: int):
+        self.errors = errors
+        self.row_count = row_count
+        IngestionError.__init__(
+            self,
+            f"Validation failed for {len(errors)} column(s) ({row_count} rows). "
+            f"First error: {errors[0] if errors else 'N/A'}",
+        )
+
+
 class ColumnMappingError(IngestionError):
     """Required column not found in source data."""
 
@@ -1,5 +1,6 @@
 from .cleaner import apply_cleaning
 from .enricher import enrich
 from .loader import DataIngestionPipeline
+from .validator import validate_schema
 
-__all__ = ["DataIngestionPipeline", "apply_cleaning", "enrich"]
+__all__ = ["DataIngestionPipeline", "apply_cleaning", "enrich", "validate_schema"]
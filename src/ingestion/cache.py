@@ -0,0 +1,60 @@
+"""On-disk cache helpers shared by the ingestion pipeline and report service."""
+
+import functools
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "report_gen"
+)
+
+
+def write_cache_file(path: Path, write: Callable[[Path], None]) -> None:
+    """Atomically create a cache file.
+
+    ``write`` fills a temporary file in the same directory, which is then
+    renamed over ``path``, so concurrent readers never see a partial entry
+    and concurrent writers of the same key simply replace each other.
+    Caching is best-effort: OSErrors (e.g. a read-only directory) are ignored.
+
+    Args:
+        path: Final cache file location
+        write: Callable writing the entry to the path it is given
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        tmp = Path(tmp_name)
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+@functools.cache
+def source_fingerprint(*paths: Path) -> str:
+    """Digest of Python sources, so cache entries expire on code changes.
+
+    Args:
+        paths: Source files, or directories whose ``*.py`` files (recursively)
+            are included
+
+    Returns:
+        Hex digest over the contents of every file, in sorted path order
+    """
+    files = set()
+    for path in paths:
+        files.update(path.rglob("*.py") if path.is_dir() else (path,))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(files):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
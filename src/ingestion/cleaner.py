@@ -108,6 +108,17 @@ def clean_float_column(col_name: str) -> pl.Expr:
     )
 
 
+def clean_categorical_column(col_name: str, dtype: pl.DataType) -> pl.Expr:
+    """Dictionary-encode a text column; values (including blanks) are kept.
+
+    Non-text columns are left unchanged.
+    """
+    col = pl.col(col_name)
+    if dtype == pl.String:
+        return col.cast(pl.Categorical).alias(col_name)
+    return col.alias(col_name)
+
+
 def apply_cleaning(
     df: pl.DataFrame,
     currency_cols: list[str],
@@ -116,39 +127,44 @@ def apply_cleaning(
     date_cols: list[str],
     integer_cols: list[str],
     float_cols: list[str] | None = None,
+    categorical_cols: list[str] | None = None,
 ) -> pl.DataFrame:
     """Apply all cleaning transformations to DataFrame.
 
     Only cleans columns that exist in the DataFrame.
     """
-    existing_cols = set(df.columns)
+    # The schema mapping doubles as the set of existing columns
     schema = df.schema
     exprs: list[pl.Expr] = []
 
     for col in currency_cols:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_currency_column(col))
 
     for col in percentage_cols:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_percentage_column(col))
 
     for col in datetime_cols:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_datetime_column(col, schema[col]))
 
     for col in date_cols:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_date_column(col, schema[col]))
 
     for col in integer_cols:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_integer_column(col))
 
     for col in float_cols or []:
-        if col in existing_cols:
+        if col in schema:
             exprs.append(clean_float_column(col))
 
+    for col in categorical_cols or []:
+        if col in schema:
+            exprs.append(clean_categorical_column(col, schema[col]))
+
     if exprs:
         return df.with_columns(exprs)
     return df
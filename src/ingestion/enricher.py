@@ -2,28 +2,35 @@
 
 import polars as pl
 
-WEEKEND_DAYS = {"Saturday", "Sunday"}
+# ISO weekday numbers as returned by Polars dt.weekday() (Monday = 1)
+SATURDAY = 6
 
 
-def add_week_start(df: pl.DataFrame, date_col: str = "report_day") -> pl.DataFrame:
-    """Add week_start column (Monday of that week).
+def week_start_expr(date_col: str = "report_day") -> pl.Expr:
+    """Expression for week_start column (Monday of that week).
 
     Uses ISO week definition where Monday is day 1.
     """
-    return df.with_columns(
-        pl.col(date_col).dt.truncate("1w").alias("week_start")
-    )
+    return pl.col(date_col).dt.truncate("1w").alias("week_start")
 
 
-def add_is_weekend(df: pl.DataFrame, day_col: str = "day_of_week") -> pl.DataFrame:
-    """Add is_weekend boolean based on day of week string."""
-    return df.with_columns(
-        pl.col(day_col).is_in(list(WEEKEND_DAYS)).alias("is_weekend")
-    )
+def is_weekend_expr(date_col: str = "report_day") -> pl.Expr:
+    """Expression for is_weekend boolean derived from the parsed date."""
+    return (pl.col(date_col).dt.weekday() >= SATURDAY).alias("is_weekend")
+
+
+def weekday_expr(date_col: str = "report_day") -> pl.Expr:
+    """Expression for ISO weekday number (Monday = 1 ... Sunday = 7)."""
+    return pl.col(date_col).dt.weekday().alias("weekday")
+
+
+def day_ordinal_expr(date_col: str = "report_day") -> pl.Expr:
+    """Expression for day of year (1-366)."""
+    return pl.col(date_col).dt.ordinal_day().alias("day_ordinal")
 
 
 def enrich(df: pl.DataFrame) -> pl.DataFrame:
-    """Apply all enrichment transformations."""
-    df = add_week_start(df)
-    df = add_is_weekend(df)
-    return df
+    """Apply all enrichment transformations in a single pass."""
+    return df.with_columns(
+        [week_start_expr(), is_weekend_expr(), weekday_expr(), day_ordinal_expr()]
+    )
@@ -1,41 +1,91 @@
 """Main data ingestion pipeline."""
 
+import functools
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 import yaml
-from pydantic import BaseModel, ValidationError
 
-from ..exceptions import ColumnMappingError, DataValidationError, SchemaLoadError
-from ..models.campaign_report import CampaignReportRow
-from ..models.domain_report import DomainReportRow
+from ..exceptions import ColumnMappingError, SchemaLoadError
+from .cache import source_fingerprint, write_cache_file
 from .cleaner import apply_cleaning
 from .enricher import enrich
+from .validator import validate_schema
 
-# Map schema names to validation models
-SCHEMA_MODELS: dict[str, type[BaseModel]] = {
-    "domain_report": DomainReportRow,
-    "campaign_report": CampaignReportRow,
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Code whose changes invalidate cached ingested frames
+_INGESTION_SOURCES = (
+    Path(__file__),
+    Path(__file__).with_name("cleaner.py"),
+    Path(__file__).with_name("enricher.py"),
+)
+
+# Code whose changes invalidate ".validated" markers
+_VALIDATION_SOURCES = (
+    Path(__file__).with_name("validator.py"),
+    Path(__file__).parent.parent / "models",
+)
+
+# Excel columns that may be empty/sparse and need type hints, per report type
+EXCEL_SCHEMA_OVERRIDES: dict[str, dict[str, type[pl.DataType]]] = {
+    "domain_report": {
+        "Line Items Flight End Date": pl.String,
+        "Line Items Flight Name": pl.String,
+        "Line Items Flight Start Date": pl.String,
+        "Domain Report Video Complete Percent": pl.String,
+    },
+    "campaign_report": {
+        "Line Items Flight End Date": pl.String,
+        "Line Items Flight Name": pl.String,
+        "Line Items Flight Start Date": pl.String,
+        "Line Items Flight Budget": pl.String,
+        "Performance Report Video Complete Percent": pl.String,
+    },
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _load_schema_cached(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a schema YAML file, cached by resolved path and modification time.
+
+    The returned dict is shared by every pipeline using the same file and
+    must be treated as read-only.
+    """
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+
 class DataIngestionPipeline:
     """Pipeline for loading, cleaning, validating, and enriching ad data.
 
+    With a ``cache_dir`` (e.g. ``cache.DEFAULT_CACHE_DIR``), ingested frames
+    (after rename, cleaning and enrichment) are cached there as parquet
+    files, keyed by source path, modification time, schema and ingestion
+    code, so later runs skip parsing and cleaning until any of them change.
+    A full file that passed validation gets a ``.validated`` marker next to
+    its cache entry, so it is not validated again either. Entries are never
+    evicted, so only enable the cache for stable input files.
+
     Usage:
         pipeline = DataIngestionPipeline(Path("src/config/schema_registry.yaml"))
         df = pipeline.ingest(Path("Files/Input/Domain Report.xlsx"))
     """
 
-    def __init__(self, schema_path: Path):
+    def __init__(self, schema_path: Path, cache_dir: Path | None = None):
         self.schema = self._load_schema(schema_path)
+        self.cache_dir = cache_dir  # None disables caching
 
     def _load_schema(self, path: Path) -> dict[str, Any]:
         """Load schema configuration from YAML."""
         try:
-            with open(path) as f:
-                return yaml.safe_load(f)
+            resolved = path.resolve()
+            return _load_schema_cached(resolved, resolved.stat().st_mtime_ns)
         except Exception as e:
             raise SchemaLoadError(f"Failed to load schema from {path}: {e}") from e
 
@@ -44,21 +94,118 @@ class DataIngestionPipeline:
         file_path: Path,
         schema_name: str = "domain_report",
         validate: bool = True,
+        predicate: pl.Expr | None = None,
     ) -> pl.DataFrame:
-        """Full pipeline: Load -> Rename -> Clean -> Enrich -> Validate.
+        """Full pipeline: Load -> Rename -> Clean -> Enrich -> Filter -> Validate.
+
+        The Load -> Enrich steps and validation are cached per file version
+        when the pipeline has a cache_dir (see class doc).
 
         Args:
-            file_path: Path to Excel or CSV file
+            file_path: Path to Excel, parquet or CSV file. For Excel input a
+                ``.parquet`` sibling (see export_parquet) is read instead when
+                it is at least as new as the workbook.
             schema_name: Key in schema registry (default: domain_report)
-            validate: Whether to run Pydantic validation (default: True)
+            validate: Whether to check dtypes and required values against
+                the schema's model (default: True)
+            predicate: Optional row filter on cleaned internal columns, e.g.
+                ``pl.col("campaign_id") == 4512``. Applied to the cached
+                frame before validation so discarded rows skip that step.
+                Filtered frames are always validated.
 
         Returns:
             Cleaned and enriched Polars DataFrame
         """
+        # Drop unwanted rows before validation; on a cache hit the filter is
+        # pushed down into the parquet scan
+        df = self.scan(file_path, schema_name, predicate).collect()
+
+        # Validate against the schema's model, once per file version
+        if validate:
+            marker = None
+            if predicate is None and self.cache_dir is not None:
+                marker = self._marker_path(self.resolve_source(file_path), schema_name)
+            if marker is None or not marker.exists():
+                self._validate(df, schema_name)
+                if marker is not None:
+                    write_cache_file(marker, lambda tmp: tmp.write_bytes(b""))
+
+        return df
+
+    def scan(
+        self,
+        file_path: Path,
+        schema_name: str = "domain_report",
+        predicate: pl.Expr | None = None,
+    ) -> pl.LazyFrame:
+        """Lazy Load -> Rename -> Clean -> Enrich -> Filter, without validation.
+
+        Once the cleaned frame is cached this is a ``pl.scan_parquet`` of the
+        cache file, so column selections and filters applied by the caller
+        are pushed down into the read and only the surviving rows are ever
+        materialized. On a cache miss, or without a cache_dir, the file is
+        processed eagerly first.
+
+        Args:
+            file_path: Path to Excel, parquet or CSV file (see ingest)
+            schema_name: Key in schema registry (default: domain_report)
+            predicate: Optional row filter on cleaned internal columns
+
+        Returns:
+            LazyFrame over the cleaned and enriched data
+        """
+        path = self.resolve_source(file_path)
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(path, schema_name)
+        if cache_path is not None and cache_path.exists():
+            lf = pl.scan_parquet(cache_path)
+        else:
+            lf = self._process(path, schema_name, cache_path).lazy()
+        return lf if predicate is None else lf.filter(predicate)
+
+    def export_parquet(
+        self, path: Path, schema_name: str = "domain_report"
+    ) -> Path:
+        """Convert an Excel workbook to a raw parquet sibling (``<stem>.parquet``).
+
+        Later ingests of the workbook read the sibling instead while it is at
+        least as new as the workbook.
+
+        Args:
+            path: Path to the Excel file
+            schema_name: Key in schema registry, selecting the dtype overrides
+
+        Returns:
+            Path of the written parquet file
+        """
+        target = path.with_suffix(".parquet")
+        self._load(path, schema_name).write_parquet(
+            target, compression="zstd", statistics=True
+        )
+        return target
+
+    def resolve_source(self, path: Path) -> Path:
+        """File ingest() actually reads for path: an up-to-date parquet sibling
+        of an Excel workbook if there is one, else path itself."""
+        if path.suffix.lower() in (".xlsx", ".xls"):
+            sibling = path.with_suffix(".parquet")
+            try:
+                if sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                    return sibling
+            except FileNotFoundError:
+                pass
+        return path
+
+    def _process(
+        self, path: Path, schema_name: str, cache_path: Path | None
+    ) -> pl.DataFrame:
+        """Load, rename, clean and enrich a file, writing it to cache_path
+        if given."""
         schema = self.schema[schema_name]
 
         # Load raw data
-        df = self._load(file_path, schema_name)
+        df = self._load(path, schema_name)
 
         # Rename columns to internal names
         df = self._rename_columns(df, schema["column_map"])
@@ -69,38 +216,56 @@ class DataIngestionPipeline:
         # Add derived columns
         df = enrich(df)
 
-        # Validate against Pydantic model
-        if validate:
-            self._validate(df, schema_name)
-
+        if cache_path is not None:
+            write_cache_file(
+                cache_path, lambda tmp: df.write_parquet(tmp, compression="zstd")
+            )
         return df
 
+    def _marker_path(self, path: Path, schema_name: str) -> Path:
+        """Validation marker for an ingested source.
+
+        Keyed like the cache file plus a digest of the validator and model
+        code, so changed validation rules revalidate every file.
+        """
+        cache_path = self._cache_path(path, schema_name)
+        fingerprint = source_fingerprint(*_VALIDATION_SOURCES)
+        return cache_path.with_name(f"{cache_path.stem}-{fingerprint}.validated")
+
+    def _cache_path(self, path: Path, schema_name: str) -> Path:
+        """Cache file for an ingested source, keyed by file version, schema and
+        ingestion code."""
+        resolved = path.resolve()
+        key = json.dumps(
+            [
+                source_fingerprint(*_INGESTION_SOURCES),
+                str(resolved),
+                resolved.stat().st_mtime_ns,
+                schema_name,
+                self.schema[schema_name],
+                sorted(EXCEL_SCHEMA_OVERRIDES.get(schema_name, {}).items()),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{path.stem}-{digest}.parquet"
+
     def _load(self, path: Path, schema_name: str = "domain_report") -> pl.DataFrame:
-        """Load data from Excel or CSV."""
+        """Load data from Excel, parquet or CSV."""
         suffix = path.suffix.lower()
         if suffix in (".xlsx", ".xls"):
-            # Build schema overrides based on report type
-            # These are columns that may be empty/sparse and need type hints
-            if schema_name == "domain_report":
-                schema_overrides = {
-                    "Line Items Flight End Date": pl.String,
-                    "Line Items Flight Name": pl.String,
-                    "Line Items Flight Start Date": pl.String,
-                    "Domain Report Video Complete Percent": pl.String,
-                }
-            elif schema_name == "campaign_report":
-                schema_overrides = {
-                    "Line Items Flight End Date": pl.String,
-                    "Line Items Flight Name": pl.String,
-                    "Line Items Flight Start Date": pl.String,
-                    "Line Items Flight Budget": pl.String,
-                    "Performance Report Video Complete Percent": pl.String,
-                }
-            else:
-                schema_overrides = {}
-            return pl.read_excel(path, schema_overrides=schema_overrides)
+            return pl.read_excel(
+                path, schema_overrides=EXCEL_SCHEMA_OVERRIDES.get(schema_name, {})
+            )
+        elif suffix == ".parquet":
+            return pl.read_parquet(path)
         elif suffix == ".csv":
-            return pl.read_csv(path)
+            # Read every column as a string in one pass; the cleaners cast to
+            # the target dtypes, so schema inference would be wasted work
+            return pl.scan_csv(
+                path, has_header=True, infer_schema_length=0, low_memory=True
+            ).collect()
         else:
             raise ValueError(f"Unsupported file type: {suffix}")
 
@@ -115,21 +280,14 @@ class DataIngestionPipeline:
         raw_to_internal = {v: k for k, v in column_map.items()}
 
         # Check for missing required columns
-        available = set(df.columns)
-        expected = set(raw_to_internal.keys())
-        missing = expected - available
+        available = frozenset(df.columns)
+        missing = [raw for raw in raw_to_internal if raw not in available]
 
         if missing:
-            raise ColumnMappingError(list(missing), list(available))
-
-        # Rename only columns that exist in the map
-        rename_dict = {
-            raw: internal
-            for raw, internal in raw_to_internal.items()
-            if raw in available
-        }
+            raise ColumnMappingError(missing, df.columns)
 
-        return df.rename(rename_dict)
+        # Every mapped column is present at this point
+        return df.rename(raw_to_internal)
 
     def _clean(self, df: pl.DataFrame, schema: dict[str, Any]) -> pl.DataFrame:
         """Apply cleaning transformations based on schema."""
@@ -141,25 +299,10 @@ class DataIngestionPipeline:
             date_cols=schema.get("date_only_columns", []),
             integer_cols=schema.get("integer_columns", []),
             float_cols=schema.get("float_columns", []),
+            categorical_cols=schema.get("categorical_columns", []),
         )
 
     def _validate(self, df: pl.DataFrame, schema_name: str) -> None:
-        """Validate each row against Pydantic model.
-
-        Collects all errors before raising, for better debugging.
-        """
-        model = SCHEMA_MODELS.get(schema_name)
-        if model is None:
-            raise ValueError(f"No validation model for schema: {schema_name}")
-
-        errors: list[dict[str, Any]] = []
-        rows = df.to_dicts()
-
-        for i, row in enumerate(rows):
-            try:
-                model.model_validate(row)
-            except ValidationError as e:
-                errors.append({"row": i, "errors": e.errors()})
-
-        if errors:
-            raise DataValidationError(errors, len(rows))
+        """Check the frame against the schema's model with vectorized dtype
+        casts and null counts (see validator.validate_schema)."""
+        validate_schema(df, schema_name)
@@ -1,40 +1,165 @@
 """Validation utilities for the ingestion pipeline."""
 
-from typing import Any
+from datetime import date
+from types import NoneType
+from typing import Any, Union, get_args, get_origin
 
 import polars as pl
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from ..exceptions import DataValidationError
+from ..exceptions import ColumnValidationError, DataValidationError
+from ..models.campaign_report import CampaignReportRow
 from ..models.domain_report import DomainReportRow
 
+# Map schema names to validation models
+SCHEMA_MODELS: dict[str, type[BaseModel]] = {
+    "domain_report": DomainReportRow,
+    "campaign_report": CampaignReportRow,
+}
 
-def validate_dataframe(df: pl.DataFrame) -> None:
-    """Validate each row against Pydantic model.
+# One compiled list validator per schema, so a whole frame is validated in a
+# single pydantic-core call instead of one model_validate per row
+SCHEMA_ADAPTERS: dict[str, TypeAdapter[list[Any]]] = {
+    name: TypeAdapter(list[model]) for name, model in SCHEMA_MODELS.items()
+}
+
+
+def _field_specs(model: type[BaseModel]) -> list[tuple[str, Any, bool, bool]]:
+    """(name, Python type, is Optional, is required) for each model field."""
+    specs = []
+    for name, field in model.model_fields.items():
+        py_type, optional = _unwrap_optional(field.annotation)
+        specs.append((name, py_type, optional, field.is_required()))
+    return specs
+
+
+def validate_dataframe(df: pl.DataFrame, schema_name: str = "domain_report") -> None:
+    """Validate all rows against the schema's Pydantic model.
+
+    Collects all errors before raising, for better debugging.
 
     Args:
         df: Cleaned and enriched DataFrame
+        schema_name: Key in SCHEMA_MODELS (default: domain_report)
 
     Raises:
         DataValidationError: If any rows fail validation
     """
-    errors: list[dict[str, Any]] = []
+    adapter = SCHEMA_ADAPTERS.get(schema_name)
+    if adapter is None:
+        raise ValueError(f"No validation model for schema: {schema_name}")
+
     rows = df.to_dicts()
+    try:
+        adapter.validate_python(rows)
+    except ValidationError as e:
+        raise DataValidationError(_group_errors_by_row(e), len(rows)) from e
+
+
+def validate_schema(df: pl.DataFrame, schema_name: str = "domain_report") -> None:
+    """Vectorized check of a typed frame against the schema's Pydantic model.
+
+    Mirrors the strict models: a column's dtype must hold the field type
+    (integers count as floats), except that an all-null column of any dtype
+    passes, since its values are all None. Required fields must have no
+    nulls. The frame itself is not modified.
+
+    Raises:
+        ColumnValidationError: If any column is missing, has the wrong dtype,
+            or has nulls in a required field
+    """
+    fields = SCHEMA_FIELDS.get(schema_name)
+    if fields is None:
+        raise ValueError(f"No validation model for schema: {schema_name}")
+
+    errors: list[dict[str, Any]] = []
+    schema = df.schema
+    required: list[str] = []
 
-    for i, row in enumerate(rows):
-        try:
-            DomainReportRow.model_validate(row)
-        except ValidationError as e:
-            errors.append({"row": i, "errors": e.errors()})
+    for name, py_type, optional, is_required in fields:
+        if name not in schema:
+            if is_required:
+                errors.append({"column": name, "error": "missing column"})
+            continue
+
+        if not optional:
+            required.append(name)
+        if _dtype_matches(schema[name], py_type):
+            continue
+
+        if df[name].null_count() != len(df):
+            expected = getattr(py_type, "__name__", py_type)
+            errors.append(
+                {"column": name, "error": f"expected {expected}, got {schema[name]}"}
+            )
+
+    if required:
+        null_counts = df.select(pl.col(required).null_count()).row(0)
+        errors.extend(
+            {"column": name, "error": f"{count} null values"}
+            for name, count in zip(required, null_counts)
+            if count
+        )
 
     if errors:
-        raise DataValidationError(errors, len(rows))
+        raise ColumnValidationError(errors, len(df))
+
+
+def validate_sample(
+    df: pl.DataFrame, sample_size: int = 100, schema_name: str = "domain_report"
+) -> None:
+    """Validate an evenly spaced sample for quick sanity checks.
+
+    Useful for large datasets where full validation is slow. Sampling is
+    strided rather than random, so repeated runs check the same rows.
+    """
+    n = min(sample_size, len(df))
+    if n == len(df):
+        validate_dataframe(df, schema_name)
+        return
 
+    sample = df.gather_every(len(df) // n).head(n)
+    validate_dataframe(sample, schema_name)
 
-def validate_sample(df: pl.DataFrame, sample_size: int = 100) -> None:
-    """Validate a random sample for quick sanity checks.
 
-    Useful for large datasets where full validation is slow.
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    """Split Optional[X] into (X, True); other annotations into (X, False)."""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not NoneType]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _dtype_matches(dtype: pl.DataType, py_type: Any) -> bool:
+    """Whether a Polars dtype holds values of the given Python type."""
+    if py_type is bool:
+        return dtype == pl.Boolean
+    if py_type is int:
+        return dtype.is_integer()
+    if py_type is float:
+        return dtype.is_numeric()
+    if py_type is str:
+        return dtype == pl.String or dtype == pl.Categorical
+    if py_type is date:
+        return dtype == pl.Date
+    return False
+
+
+def _group_errors_by_row(error: ValidationError) -> list[dict[str, Any]]:
+    """Regroup list-level validation errors into per-row entries.
+
+    The leading list index is stripped from each error location so entries
+    look the same as errors from validating a single row.
     """
-    sample = df.sample(min(sample_size, len(df)))
-    validate_dataframe(sample)
+    by_row: dict[int, list[Any]] = {}
+    for err in error.errors():
+        row, *loc = err["loc"]
+        by_row.setdefault(row, []).append({**err, "loc": tuple(loc)})
+    return [{"row": row, "errors": errs} for row, errs in by_row.items()]
+
+
+# Field specs per schema, derived from the models once at import
+SCHEMA_FIELDS: dict[str, list[tuple[str, Any, bool, bool]]] = {
+    name: _field_specs(model) for name, model in SCHEMA_MODELS.items()
+}
@@ -1,4 +1,9 @@
-from .campaign_report import CampaignReportRow
-from .domain_report import DomainReportRow
+from .campaign_report import CampaignReportRow, CampaignReportRowDict
+from .domain_report import DomainReportRow, DomainReportRowDict
 
-__all__ = ["CampaignReportRow", "DomainReportRow"]
+__all__ = [
+    "CampaignReportRow",
+    "CampaignReportRowDict",
+    "DomainReportRow",
+    "DomainReportRowDict",
+]
@@ -1,11 +1,77 @@
 """Pydantic models for campaign report validation."""
 
 from datetime import date
-from typing import Optional
+from typing import Optional, TypedDict
 
 from pydantic import BaseModel, ConfigDict
 
 
+class CampaignReportRowDict(TypedDict):
+    """Row dict shape of CampaignReportRow, as produced by ``DataFrame.to_dicts()``.
+
+    For static typing of typed rows only; nothing is validated at runtime.
+    """
+
+    # Campaign info
+    campaign_name: str
+    campaign_id: int
+    campaign_start: date
+    campaign_end: date
+    campaign_budget: float
+
+    # Creative info
+    creative_size: str
+    creative_name: str
+    creative_id: int
+    video_duration: Optional[int]
+
+    # Flight info (optional - often empty)
+    flight_budget: Optional[float]
+    flight_end: Optional[date]
+    flight_name: Optional[str]
+    flight_start: Optional[date]
+    flight_id: int
+
+    # Line item info
+    line_item_budget: float
+    line_item_budget_type: str
+    line_item_daily_budget: float
+    line_item_end: date
+    line_item_name: str
+    line_item_id: int
+    line_item_start: date
+
+    # Temporal fields
+    report_day: date
+    day_of_week: str
+    month: str
+    week: date
+    year: int
+
+    # Inventory info
+    inventory_source: str
+    platform_device_type: str
+
+    # Performance metrics
+    cpm: float
+    impressions: int
+    clicks: int
+    ctr: float  # Decimal: 0.05 = 5%
+    spend: float
+    frequency: Optional[float]  # Can be null, stored as float
+    reach: int
+    video_complete_pct: Optional[float]  # Often empty
+    video_completes: int
+    viewability_pct: Optional[float]  # Can be null
+    viewable_impressions: int
+
+    # Enriched fields (added by pipeline)
+    week_start: date
+    is_weekend: bool
+    weekday: int  # ISO: Monday = 1
+    day_ordinal: int  # Day of year
+
+
 class CampaignReportRow(BaseModel):
     """Single row from campaign report after cleaning.
 
@@ -71,3 +137,5 @@ class CampaignReportRow(BaseModel):
     # Enriched fields (added by pipeline)
     week_start: date
     is_weekend: bool
+    weekday: int  # ISO: Monday = 1
+    day_ordinal: int  # Day of year
@@ -1,16 +1,48 @@
 """StatPack - consolidated analytics output for LLM consumption."""
 
+import io
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any
+from operator import itemgetter
+from typing import Any, BinaryIO
 
+import orjson
+import polars as pl
 
-@dataclass
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Pre-bound message templates and field getters for insight triggers
+_GOAL_EXCEEDED_FMT = "Campaign exceeded impression goal by %.1f%%".__mod__
+_GOAL_SHORTFALL_FMT = "Campaign at %.1f%% of goal".__mod__
+_BACK_LOADED_FMT = "Back-loaded delivery: %.1f%% in last 25%% of campaign".__mod__
+_WEEKEND_LIFT_FMT = "Weekend engagement %.1f%% higher than weekdays".__mod__
+_SPIKE_FMT = "%.1f%% %s in %s on %s".__mod__
+_ANOMALY_FMT = "Anomalous %s (%s) on %s".__mod__
+_GAP_FMT = "%.0f%% %s gap between %s and %s".__mod__
+_spike_fields = itemgetter("pct_change", "metric", "week")
+_anomaly_fields = itemgetter("metric", "direction", "week")
+_gap_fields = itemgetter("gap_pct", "metric", "max_platform", "min_platform")
+
+
+def _pct(x: float | None, n: int) -> float | None:
+    """Rate as a rounded percentage; None when missing or zero."""
+    return round(x * 100, n) if x else None
+
+
+def _round4(x: float | None) -> float | None:
+    """Round to 4 places, passing None through."""
+    return None if x is None else round(x, 4)
+
+
+@dataclass(slots=True)
 class StatPack:
     """Consolidated analytics output structured for LLM consumption.
 
-    All data is pre-computed and JSON-serializable.
+    All data is pre-computed and JSON-serializable. Treat instances as
+    immutable once built: the executive summary and insight triggers are
+    computed on first access and cached.
     """
 
     # Metadata
@@ -38,7 +70,7 @@ class StatPack:
     spikes: list[dict[str, Any]]
 
     # Efficiency analysis
-    domain_rankings: list[dict[str, Any]]
+    domain_rankings: pl.DataFrame = field(compare=False)  # by avg_ctr, descending
     platform_comparison: list[dict[str, Any]]
     performance_gaps: list[dict[str, Any]]
     weekend_vs_weekday: dict[str, Any]
@@ -52,74 +84,133 @@ class StatPack:
     # Normalized metrics summary
     normalized_metrics: dict[str, Any]
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return {
-            "meta": {
-                "generated_at": self.generated_at.isoformat(),
-                "campaign_id": self.campaign_id,
-                "date_range": {
-                    "start": self.date_range[0].isoformat(),
-                    "end": self.date_range[1].isoformat(),
-                },
-                "total_rows": self.total_rows,
-            },
-            "aggregates": {
-                "total_impressions": self.total_impressions,
-                "total_clicks": self.total_clicks,
-                "total_spend": round(self.total_spend, 2),
-                "avg_ctr": round(self.avg_ctr * 100, 4),  # Convert to percentage
-                "avg_cpm": round(self.avg_cpm, 2),
-                "avg_vcr": round(self.avg_vcr * 100, 2) if self.avg_vcr else None,
-                "avg_viewability": (
-                    round(self.avg_viewability * 100, 2)
-                    if self.avg_viewability
-                    else None
-                ),
-            },
-            "goal_tracking": {
-                "progress": self.goal_progress,
-                "delivery_pattern": self.delivery_pattern,
-            },
-            "temporal": {
-                "weekly": self.weekly_performance,
-                "wow_changes": self.wow_changes,
-                "spikes": self.spikes,
-            },
-            "efficiency": {
-                "top_domains": self.domain_rankings[:10],
-                "bottom_domains": self.domain_rankings[-10:]
-                if len(self.domain_rankings) > 10
-                else [],
-                "platforms": self.platform_comparison,
-                "gaps": self.performance_gaps,
-                "weekend_lift": self.weekend_vs_weekday,
-            },
-            "anomalies": self.anomalies,
-            "correlations": {
-                k: round(v, 4) if v is not None else None
-                for k, v in self.correlations.items()
+    # Scalars hoisted out of the dicts above (set in __post_init__)
+    completion_pct: float | None = field(init=False, repr=False, compare=False)
+    is_back_loaded: bool = field(init=False, repr=False, compare=False)
+    last_quarter_pct: float = field(init=False, repr=False, compare=False)
+    weekend_lift: float | None = field(init=False, repr=False, compare=False)
+    _corr_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    # Lazily built views (see get_executive_summary / get_insights_triggers)
+    _exec_summary_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _triggers_cache: list[dict[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Hoist the scalars read by the summary and trigger builders."""
+        self.completion_pct = self.goal_progress.get("completion_pct")
+        self.is_back_loaded = bool(self.delivery_pattern.get("is_back_loaded"))
+        self.last_quarter_pct = self.delivery_pattern.get("last_quarter_pct", 0)
+        self.weekend_lift = self.weekend_vs_weekday.get("lift")
+        self._corr_keys = tuple(self.correlations)
+
+    def _sections(self) -> Iterator[tuple[str, Any]]:
+        """Yield the top-level (key, value) sections of the serialized form.
+
+        Sections are built lazily so writers can encode one at a time.
+        """
+        yield "meta", {
+            "generated_at": self.generated_at.isoformat(),
+            "campaign_id": self.campaign_id,
+            "date_range": {
+                "start": self.date_range[0].isoformat(),
+                "end": self.date_range[1].isoformat(),
             },
-            "normalized": self.normalized_metrics,
+            "total_rows": self.total_rows,
+        }
+        yield "aggregates", {
+            "total_impressions": self.total_impressions,
+            "total_clicks": self.total_clicks,
+            "total_spend": round(self.total_spend, 2),
+            "avg_ctr": round(self.avg_ctr * 100, 4),  # Convert to percentage
+            "avg_cpm": round(self.avg_cpm, 2),
+            "avg_vcr": _pct(self.avg_vcr, 2),
+            "avg_viewability": _pct(self.avg_viewability, 2),
+        }
+        yield "goal_tracking", {
+            "progress": self.goal_progress,
+            "delivery_pattern": self.delivery_pattern,
         }
+        yield "temporal", {
+            "weekly": self.weekly_performance,
+            "wow_changes": self.wow_changes,
+            "spikes": self.spikes,
+        }
+
+        rankings = self.domain_rankings
+        yield "efficiency", {
+            "top_domains": rankings.head(10).to_dicts(),
+            "bottom_domains": rankings.tail(10).to_dicts() if len(rankings) > 10 else [],
+            "platforms": self.platform_comparison,
+            "gaps": self.performance_gaps,
+            "weekend_lift": self.weekend_vs_weekday,
+        }
+        yield "anomalies", self.anomalies
+
+        keys = self._corr_keys
+        yield "correlations", dict(
+            zip(keys, map(_round4, map(self.correlations.__getitem__, keys)))
+        )
+        yield "normalized", self.normalized_metrics
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return dict(self._sections())
+
+    def write_json(self, fp: BinaryIO) -> None:
+        """Write compact JSON to a binary file object.
+
+        Each top-level section is encoded and written on its own, so the
+        full to_dict() tree is never materialized at once.
+        """
+        fp.write(b"{")
+        for i, (key, value) in enumerate(self._sections()):
+            if i:
+                fp.write(b",")
+            fp.write(orjson.dumps(key))
+            fp.write(b":")
+            fp.write(orjson.dumps(value, default=str, option=_ORJSON_OPTS))
+        fp.write(b"}")
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize to JSON string.
+
+        Encodes with orjson. indent=None streams compact output through
+        write_json(); indent=2 pretty-prints, and other indent widths fall
+        back to the stdlib encoder.
+        """
+        if indent is None:
+            buf = io.BytesIO()
+            self.write_json(buf)
+            return buf.getvalue().decode()
+        if indent != 2:
+            return json.dumps(self.to_dict(), indent=indent, default=str)
 
-    def to_json(self, indent: int = 2) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        option = _ORJSON_OPTS | orjson.OPT_INDENT_2
+        return orjson.dumps(self.to_dict(), default=str, option=option).decode()
 
     def get_executive_summary(self) -> dict[str, Any]:
         """Get condensed summary for executive overview.
 
         Returns key metrics only, suitable for report headers.
         """
+        if self._exec_summary_cache is None:
+            self._exec_summary_cache = self._build_executive_summary()
+        return self._exec_summary_cache
+
+    def _build_executive_summary(self) -> dict[str, Any]:
+        """Build the executive summary (uncached)."""
         return {
             "campaign_id": self.campaign_id,
             "total_impressions": self.total_impressions,
             "total_spend": round(self.total_spend, 2),
-            "goal_completion_pct": self.goal_progress.get("completion_pct"),
+            "goal_completion_pct": self.completion_pct,
             "avg_ctr_pct": round(self.avg_ctr * 100, 2),
-            "avg_vcr_pct": round(self.avg_vcr * 100, 2) if self.avg_vcr else None,
-            "is_back_loaded": self.delivery_pattern.get("is_back_loaded"),
+            "avg_vcr_pct": _pct(self.avg_vcr, 2),
+            "is_back_loaded": self.is_back_loaded,
             "anomaly_count": len(self.anomalies),
             "top_spike": self.spikes[0] if self.spikes else None,
         }
@@ -129,73 +220,77 @@ class StatPack:
 
         Returns list of triggered insights with type and message.
         """
+        if self._triggers_cache is None:
+            self._triggers_cache = self._build_insights_triggers()
+        return self._triggers_cache
+
+    def _build_insights_triggers(self) -> list[dict[str, str]]:
+        """Build the insight trigger list (uncached)."""
         triggers = []
 
-        # Goal completion trigger
-        completion_pct = self.goal_progress.get("completion_pct", 0)
-        if completion_pct > 100:
+        # Goal completion trigger (only when a goal is set)
+        completion_pct = self.completion_pct
+        if completion_pct is not None and completion_pct > 100:
             triggers.append(
                 {
                     "type": "delivery_success",
-                    "message": f"Campaign exceeded impression goal by {completion_pct - 100:.1f}%",
+                    "message": _GOAL_EXCEEDED_FMT((completion_pct - 100,)),
                 }
             )
-        elif completion_pct < 90:
+        elif completion_pct is not None and completion_pct < 90:
             triggers.append(
                 {
                     "type": "delivery_warning",
-                    "message": f"Campaign at {completion_pct:.1f}% of goal",
+                    "message": _GOAL_SHORTFALL_FMT((completion_pct,)),
                 }
             )
 
         # Back-loaded delivery trigger
-        if self.delivery_pattern.get("is_back_loaded"):
-            last_q_pct = self.delivery_pattern.get("last_quarter_pct", 0)
+        if self.is_back_loaded:
             triggers.append(
                 {
                     "type": "pacing_insight",
-                    "message": f"Back-loaded delivery: {last_q_pct * 100:.1f}% in last 25% of campaign",
+                    "message": _BACK_LOADED_FMT((self.last_quarter_pct * 100,)),
                 }
             )
 
         # Weekend lift trigger
-        lift = self.weekend_vs_weekday.get("lift")
+        lift = self.weekend_lift
         if lift and lift > 0.05:  # >5% lift
             triggers.append(
                 {
                     "type": "timing_insight",
-                    "message": f"Weekend engagement {lift * 100:.1f}% higher than weekdays",
+                    "message": _WEEKEND_LIFT_FMT((lift * 100,)),
                 }
             )
 
-        # Spike triggers
-        for spike in self.spikes[:3]:  # Top 3 spikes
-            pct = spike.get("pct_change", 0)
-            direction = "spike" if pct > 0 else "drop"
-            triggers.append(
-                {
-                    "type": "temporal_spike",
-                    "message": f"{abs(pct) * 100:.1f}% {direction} in {spike.get('metric')} on {spike.get('week')}",
-                }
-            )
+        # Spike triggers (top 3)
+        triggers.extend(
+            {
+                "type": "temporal_spike",
+                "message": _SPIKE_FMT(
+                    (abs(pct) * 100, "spike" if pct > 0 else "drop", metric, week)
+                ),
+            }
+            for pct, metric, week in map(_spike_fields, self.spikes[:3])
+        )
 
-        # Anomaly triggers
-        for anomaly in self.anomalies[:2]:  # Top 2 anomalies
-            triggers.append(
-                {
-                    "type": "anomaly",
-                    "message": f"Anomalous {anomaly.get('metric')} ({anomaly.get('direction')}) on {anomaly.get('week')}",
-                }
-            )
+        # Anomaly triggers (top 2)
+        triggers.extend(
+            {"type": "anomaly", "message": _ANOMALY_FMT(fields)}
+            for fields in map(_anomaly_fields, self.anomalies[:2])
+        )
 
         # Platform gap trigger
-        for gap in self.performance_gaps:
-            if gap.get("gap_pct", 0) > 0.5:  # >50% gap
-                triggers.append(
-                    {
-                        "type": "platform_gap",
-                        "message": f"{gap.get('gap_pct') * 100:.0f}% {gap.get('metric')} gap between {gap.get('max_platform')} and {gap.get('min_platform')}",
-                    }
-                )
+        wide_gaps = [g for g in self.performance_gaps if g.get("gap_pct", 0) > 0.5]
+        triggers.extend(
+            {
+                "type": "platform_gap",
+                "message": _GAP_FMT((gap_pct * 100, metric, max_platform, min_platform)),
+            }
+            for gap_pct, metric, max_platform, min_platform in map(
+                _gap_fields, wide_gaps
+            )
+        )
 
         return triggers
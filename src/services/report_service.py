@@ -1,5 +1,10 @@
 """Report service - orchestrates data ingestion and analytics."""
 
+import hashlib
+import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -15,13 +20,37 @@ from ..analytics import (
     InsightEngine,
     InsightThresholds,
 )
-from ..ingestion import DataIngestionPipeline
+from ..analytics.expressions import pct_expr
+from ..ingestion import DataIngestionPipeline, validate_schema
+from ..ingestion.cache import DEFAULT_CACHE_DIR, source_fingerprint, write_cache_file
 from ..models.stat_pack import StatPack
 
-DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / "config" / "schema_registry.yaml"
+_PACKAGE_DIR = Path(__file__).parent.parent
+DEFAULT_SCHEMA_PATH = _PACKAGE_DIR / "config" / "schema_registry.yaml"
 
 
-@dataclass
+def _code_fingerprint() -> str:
+    """Digest of the package sources, so cached reports expire on code changes."""
+    return source_fingerprint(_PACKAGE_DIR)
+
+
+def _nonzero_round_expr(col: str, digits: int) -> pl.Expr:
+    """Rounded column value; null when zero or missing."""
+    return pl.when(pl.col(col) != 0).then(pl.col(col).round(digits))
+
+
+def _format_rows(rows: list[Any], *exprs: pl.Expr) -> list[dict[str, Any]]:
+    """Evaluate output expressions over a list of dataclass rows as dicts.
+
+    Rounding and percentage conversion run in Polars for the whole list
+    rather than per value in Python.
+    """
+    if not rows:
+        return []
+    return pl.DataFrame(rows).select(*exprs).to_dicts()
+
+
+@dataclass(slots=True)
 class ReportOutput:
     """Consolidated output from report generation."""
 
@@ -54,14 +83,87 @@ class ReportService:
         )
     """
 
-    def __init__(self, schema_path: Path | None = None):
+    def __init__(
+        self,
+        schema_path: Path | None = None,
+        cache_dir: Path | None = None,
+        cache_reports: bool = False,
+    ):
         """Initialize service with schema configuration.
 
         Args:
             schema_path: Path to schema_registry.yaml. Defaults to bundled config.
+            cache_dir: Directory for the ingestion cache (see
+                DataIngestionPipeline); None (default) disables it.
+            cache_reports: Whether generate_report() results are pickled to
+                ``cache_dir/reports`` (``DEFAULT_CACHE_DIR/reports`` without
+                a cache_dir) and reused while inputs and code are
+                unchanged (default False). Entries are never evicted, so
+                only enable it for stable input paths, not per-upload
+                temporary files.
         """
         self.schema_path = schema_path or DEFAULT_SCHEMA_PATH
-        self.pipeline = DataIngestionPipeline(self.schema_path)
+        self.pipeline = DataIngestionPipeline(self.schema_path, cache_dir=cache_dir)
+        self.cache_reports = cache_reports
+        # {(resolved_path, mtime_ns, schema_name): unvalidated ingested frame}
+        self._ingest_cache: dict[tuple[Path, int, str], pl.DataFrame] = {}
+        self._ingest_lock = threading.Lock()
+
+    def _cached_ingest(self, path: Path, schema_name: str) -> pl.DataFrame:
+        """Ingest a report without validation, memoized per file version.
+
+        Entries are keyed by resolved path, mtime and schema, so an edited
+        file is re-ingested and its stale entry dropped. Safe to call from
+        several threads; concurrent misses may ingest the same file twice.
+        """
+        resolved = path.resolve()
+        key = (resolved, resolved.stat().st_mtime_ns, schema_name)
+        with self._ingest_lock:
+            df = self._ingest_cache.get(key)
+        if df is None:
+            df = self.pipeline.ingest(path, schema_name=schema_name, validate=False)
+            with self._ingest_lock:
+                for stale in [
+                    k
+                    for k in self._ingest_cache
+                    if k[0] == resolved and k[2] == schema_name
+                ]:
+                    del self._ingest_cache[stale]
+                self._ingest_cache[key] = df
+        return df
+
+    def _report_cache_path(
+        self,
+        campaign_id: int,
+        domain_report_path: Path,
+        campaign_report_path: Path | None,
+        campaign_goal: int | None,
+        validate: bool,
+    ) -> Path:
+        """Cache file for a report, keyed by its arguments, inputs and code."""
+        sources = [domain_report_path]
+        if campaign_report_path and campaign_report_path.exists():
+            sources.append(campaign_report_path)
+        fingerprints = []
+        for path in sources:
+            source = self.pipeline.resolve_source(path).resolve()
+            fingerprints.append((str(source), source.stat().st_mtime_ns))
+
+        key = json.dumps(
+            [
+                _code_fingerprint(),
+                self.pipeline.schema,
+                campaign_id,
+                campaign_goal,
+                validate,
+                fingerprints,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        cache_dir = self.pipeline.cache_dir or DEFAULT_CACHE_DIR
+        return cache_dir / "reports" / f"{digest}.pkl"
 
     def generate_report(
         self,
@@ -73,12 +175,18 @@ class ReportService:
     ) -> ReportOutput:
         """Generate comprehensive campaign report.
 
+        With ``cache_reports`` enabled the result is pickled to disk and
+        returned directly while the input files, arguments and package
+        sources are unchanged.
+
         Args:
             campaign_id: Campaign ID to filter data
             domain_report_path: Path to Domain Report Excel file
             campaign_report_path: Path to Campaign Report Excel file (optional)
             campaign_goal: Target impressions for goal tracking (optional)
-            validate: Whether to run Pydantic validation (default False for speed)
+            validate: Whether to check dtypes and required values of the
+                filtered data (default False for speed). The check is
+                vectorized in Polars; no per-row Pydantic models are built.
 
         Returns:
             ReportOutput with all aggregations and analytics
@@ -86,37 +194,78 @@ class ReportService:
         Raises:
             ValueError: If campaign_id not found in data
         """
-        # Ingest domain report (primary data source)
-        domain_df = self.pipeline.ingest(
-            domain_report_path,
-            schema_name="domain_report",
-            validate=validate,
+        if not self.cache_reports:
+            return self._generate_report(
+                campaign_id,
+                domain_report_path,
+                campaign_report_path,
+                campaign_goal,
+                validate,
+            )
+
+        cache_path = self._report_cache_path(
+            campaign_id, domain_report_path, campaign_report_path, campaign_goal, validate
+        )
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Corrupt or version-skewed entry: drop it and regenerate
+            cache_path.unlink(missing_ok=True)
+
+        output = self._generate_report(
+            campaign_id, domain_report_path, campaign_report_path, campaign_goal, validate
         )
+        payload = pickle.dumps(output, protocol=pickle.HIGHEST_PROTOCOL)
+        write_cache_file(cache_path, lambda tmp: tmp.write_bytes(payload))
+        return output
+
+    def _generate_report(
+        self,
+        campaign_id: int,
+        domain_report_path: Path,
+        campaign_report_path: Path | None,
+        campaign_goal: int | None,
+        validate: bool,
+    ) -> ReportOutput:
+        """Generate a report without the disk cache (see generate_report)."""
+        # Ingest the domain report (primary data source) and, if given, the
+        # campaign report for metadata; Excel parsing releases the GIL, so
+        # the two files are read in parallel
+        campaign_filter = pl.col("campaign_id") == campaign_id
+        campaign_df = None
+        if campaign_report_path and campaign_report_path.exists():
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                domain_future = pool.submit(
+                    self._cached_ingest, domain_report_path, "domain_report"
+                )
+                campaign_future = pool.submit(
+                    self.pipeline.ingest,
+                    campaign_report_path,
+                    schema_name="campaign_report",
+                    validate=False,
+                    predicate=campaign_filter,
+                )
+                all_domain_df = domain_future.result()
+                campaign_df = campaign_future.result()
+        else:
+            all_domain_df = self._cached_ingest(domain_report_path, "domain_report")
 
         # Filter by campaign_id
-        domain_df = domain_df.filter(pl.col("campaign_id") == campaign_id)
+        domain_df = all_domain_df.filter(campaign_filter)
 
         if len(domain_df) == 0:
-            available_ids = (
-                self.pipeline.ingest(
-                    domain_report_path, schema_name="domain_report", validate=False
-                )["campaign_id"]
-                .unique()
-                .to_list()
-            )
+            available_ids = all_domain_df["campaign_id"].unique().to_list()
             raise ValueError(
                 f"Campaign ID {campaign_id} not found. Available: {available_ids}"
             )
 
-        # Optionally ingest campaign report for metadata
-        campaign_df = None
-        if campaign_report_path and campaign_report_path.exists():
-            campaign_df = self.pipeline.ingest(
-                campaign_report_path,
-                schema_name="campaign_report",
-                validate=validate,
-            )
-            campaign_df = campaign_df.filter(pl.col("campaign_id") == campaign_id)
+        if validate:
+            validate_schema(domain_df, "domain_report")
+            if campaign_df is not None:
+                validate_schema(campaign_df, "campaign_report")
 
         # Initialize analytics engine
         engine = AnalyticalEngine(
@@ -124,12 +273,11 @@ class ReportService:
             campaign_goal=campaign_goal,
         )
 
-        # Run all analytics
+        # Run all analytics; the shared aggregations are collected in one batch
+        engine.collect_all()
         kpis = engine.get_campaign_kpis()
-        temporal = engine.get_temporal_stats()
         dow_stats = engine.get_dow_performance()
         top_domains, top_n_share = engine.get_domain_stats(top_n=10)
-        platform_stats = engine.get_platform_stats()
         stat_pack = engine.get_stat_pack()
 
         # Generate rule-based insights
@@ -137,42 +285,42 @@ class ReportService:
         insights = insight_engine.generate_all_insights()
 
         # Build weekly performance output
-        weekly_performance = [
-            {
-                "week": w.week_start.isoformat(),
-                "impressions": w.impressions,
-                "clicks": w.clicks,
-                "spend": round(w.spend, 2),
-                "ctr": round(w.avg_ctr * 100, 4) if w.avg_ctr else None,
-                "cpm": round(w.avg_cpm, 2) if w.avg_cpm else None,
-                "vcr": round(w.avg_vcr * 100, 2) if w.avg_vcr else None,
-                "viewability": (
-                    round(w.avg_viewability * 100, 2) if w.avg_viewability else None
-                ),
-            }
-            for w in temporal.weekly_totals
-        ]
+        weekly_performance = (
+            engine.get_weekly_totals_df()
+            .select(
+                pl.col("week_start").dt.to_string("%Y-%m-%d").alias("week"),
+                pl.col("total_impressions").alias("impressions"),
+                pl.col("total_clicks").alias("clicks"),
+                pl.col("total_spend").round(2).alias("spend"),
+                pct_expr("avg_ctr", 4).alias("ctr"),
+                _nonzero_round_expr("avg_cpm", 2).alias("cpm"),
+                pct_expr("avg_vcr", 2).alias("vcr"),
+                pct_expr("avg_viewability", 2).alias("viewability"),
+            )
+            .to_dicts()
+        )
 
         # Build platform breakdown output
-        total_impressions = domain_df["impressions"].sum()
-        platform_breakdown = [
-            {
-                "platform": p.platform,
-                "impressions": p.total_impressions,
-                "impression_share": round(
-                    p.total_impressions / total_impressions * 100, 2
-                ),
-                "spend": round(p.total_spend, 2),
-                "ctr": round(p.avg_ctr * 100, 4) if p.avg_ctr else None,
-                "vcr": round(p.avg_vcr * 100, 2) if p.avg_vcr else None,
-                "cpm": (
-                    round(p.total_spend / p.total_impressions * 1000, 2)
-                    if p.total_impressions > 0
-                    else None
-                ),
-            }
-            for p in platform_stats
-        ]
+        total_impressions = engine.total_impressions
+        platform_breakdown = (
+            engine.get_platform_stats_df()
+            .select(
+                pl.col("platform_device_type").alias("platform"),
+                pl.col("total_impressions").alias("impressions"),
+                (pl.col("total_impressions") / total_impressions * 100)
+                .round(2)
+                .alias("impression_share"),
+                pl.col("total_spend").round(2).alias("spend"),
+                pct_expr("avg_ctr", 4).alias("ctr"),
+                pct_expr("avg_vcr", 2).alias("vcr"),
+                pl.when(pl.col("total_impressions") > 0)
+                .then(
+                    (pl.col("total_spend") / pl.col("total_impressions") * 1000).round(2)
+                )
+                .alias("cpm"),
+            )
+            .to_dicts()
+        )
 
         return ReportOutput(
             campaign_id=campaign_id,
@@ -195,11 +343,7 @@ class ReportService:
         Returns:
             List of unique campaign IDs
         """
-        df = self.pipeline.ingest(
-            domain_report_path,
-            schema_name="domain_report",
-            validate=False,
-        )
+        df = self._cached_ingest(domain_report_path, "domain_report")
         return sorted(df["campaign_id"].unique().to_list())
 
     def generate_summary_dict(self, output: ReportOutput) -> dict[str, Any]:
@@ -228,32 +372,26 @@ class ReportService:
             },
             "weekly_performance": output.weekly_performance,
             "platform_breakdown": output.platform_breakdown,
-            "day_of_week_performance": [
-                {
-                    "day": d.day_of_week,
-                    "impressions": d.impressions,
-                    "clicks": d.clicks,
-                    "spend": round(d.spend, 2),
-                    "ctr_pct": round(d.avg_ctr * 100, 4) if d.avg_ctr else None,
-                    "vcr_pct": round(d.avg_vcr * 100, 2) if d.avg_vcr else None,
-                }
-                for d in output.dow_performance
-            ],
-            "top_domains": [
-                {
-                    "domain": d.domain,
-                    "impressions": d.impressions,
-                    "impression_share_pct": round(d.impression_share * 100, 2),
-                    "ctr_pct": round(d.avg_ctr * 100, 4) if d.avg_ctr else None,
-                    "vcr_pct": round(d.avg_vcr * 100, 2) if d.avg_vcr else None,
-                    "cpm": round(d.avg_cpm, 2) if d.avg_cpm else None,
-                    "viewability_pct": (
-                        round(d.avg_viewability * 100, 2) if d.avg_viewability else None
-                    ),
-                    "is_underperforming": d.is_underperforming,
-                }
-                for d in output.top_domains
-            ],
+            "day_of_week_performance": _format_rows(
+                output.dow_performance,
+                pl.col("day_of_week").alias("day"),
+                pl.col("impressions"),
+                pl.col("clicks"),
+                pl.col("spend").round(2),
+                pct_expr("avg_ctr", 4).alias("ctr_pct"),
+                pct_expr("avg_vcr", 2).alias("vcr_pct"),
+            ),
+            "top_domains": _format_rows(
+                output.top_domains,
+                pl.col("domain"),
+                pl.col("impressions"),
+                (pl.col("impression_share") * 100).round(2).alias("impression_share_pct"),
+                pct_expr("avg_ctr", 4).alias("ctr_pct"),
+                pct_expr("avg_vcr", 2).alias("vcr_pct"),
+                _nonzero_round_expr("avg_cpm", 2).alias("cpm"),
+                pct_expr("avg_viewability", 2).alias("viewability_pct"),
+                pl.col("is_underperforming"),
+            ),
             "top_10_domain_share_pct": round(output.top_n_domain_share * 100, 2),
             "insights": [
                 {
@@ -0,0 +1,63 @@
+"""Shared pytest fixtures.
+
+The real input reports are not checked in; fixtures that need them skip
+the requesting test when they are missing.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.ingestion import DataIngestionPipeline
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCHEMA_PATH = PROJECT_ROOT / "src/config/schema_registry.yaml"
+DOMAIN_REPORT_PATH = PROJECT_ROOT / "Files/Input/Domain Report.xlsx"
+CAMPAIGN_REPORT_PATH = PROJECT_ROOT / "Files/Input/Campaign Report.xlsx"
+
+
+@pytest.fixture(scope="session")
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-private ingestion cache, so tests never reuse (or write to)
+    the user's cache and always run validation at least once."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="session")
+def schema_path() -> Path:
+    """Bundled schema registry."""
+    return SCHEMA_PATH
+
+
+@pytest.fixture(scope="session")
+def pipeline(schema_path: Path, cache_dir: Path) -> DataIngestionPipeline:
+    """Ingestion pipeline for the bundled schema registry."""
+    return DataIngestionPipeline(schema_path, cache_dir=cache_dir)
+
+
+def _require(path: Path) -> Path:
+    """Return path, skipping the requesting test if it does not exist."""
+    if not path.exists():
+        pytest.skip("Test data not available")
+    return path
+
+
+@pytest.fixture(scope="session")
+def domain_report_path() -> Path:
+    """Path of the real Domain Report."""
+    return _require(DOMAIN_REPORT_PATH)
+
+
+@pytest.fixture(scope="session")
+def campaign_report_path() -> Path:
+    """Path of the real Campaign Report."""
+    return _require(CAMPAIGN_REPORT_PATH)
+
+
+@pytest.fixture(scope="session")
+def domain_df(
+    pipeline: DataIngestionPipeline, domain_report_path: Path
+) -> pl.DataFrame:
+    """Real Domain Report, ingested and validated once per session."""
+    return pipeline.ingest(domain_report_path, validate=True)
@@ -1,12 +1,15 @@
 """Tests for the analytics module."""
 
+import dataclasses
+import json
 from datetime import date
-from pathlib import Path
 
+import numpy as np
 import polars as pl
 import pytest
 
 from src.analytics import (
+    AnalysisResults,
     AnalyticalEngine,
     AnomalyReport,
     DeliveryPattern,
@@ -14,7 +17,7 @@ from src.analytics import (
     GoalProgress,
     TemporalStats,
 )
-from src.ingestion import DataIngestionPipeline
+from src.analytics.stats import detect_trend
 from src.models.stat_pack import StatPack
 
 
@@ -23,58 +26,68 @@ from src.models.stat_pack import StatPack
 # =============================================================================
 
 
-@pytest.fixture
-def sample_df() -> pl.DataFrame:
-    """Create a minimal test DataFrame."""
-    return pl.DataFrame(
-        {
-            "campaign_id": [1, 1, 1, 1, 1, 1, 1],
-            "report_day": [
-                date(2024, 1, 1),
-                date(2024, 1, 2),
-                date(2024, 1, 8),
-                date(2024, 1, 9),
-                date(2024, 1, 15),
-                date(2024, 1, 16),
-                date(2024, 1, 22),
-            ],
-            "week_start": [
-                date(2024, 1, 1),
-                date(2024, 1, 1),
-                date(2024, 1, 8),
-                date(2024, 1, 8),
-                date(2024, 1, 15),
-                date(2024, 1, 15),
-                date(2024, 1, 22),
-            ],
-            "impressions": [1000, 1200, 2000, 2500, 3000, 3500, 8000],
-            "clicks": [50, 60, 100, 125, 150, 175, 400],
-            "spend": [100.0, 120.0, 200.0, 250.0, 300.0, 350.0, 800.0],
-            "ctr": [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05],
-            "cpm": [100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
-            "domain": ["a.com", "b.com", "a.com", "b.com", "a.com", "b.com", "a.com"],
-            "platform_device_type": [
-                "Mobile",
-                "Desktop",
-                "Mobile",
-                "Desktop",
-                "Mobile",
-                "Desktop",
-                "Mobile",
-            ],
-            "is_weekend": [False, False, False, False, False, False, False],
-            "campaign_end": [date(2024, 1, 31)] * 7,
-            "video_complete_pct": [0.80, 0.85, 0.82, 0.88, 0.81, 0.87, 0.90],
-            "video_completes": [800, 1020, 1640, 2200, 2430, 3045, 7200],
-            "viewability_pct": [0.99, 0.98, 0.99, 0.97, 0.99, 0.98, 0.99],
-            "viewable_impressions": [990, 1176, 1980, 2425, 2970, 3430, 7920],
-        }
-    )
+# Built once at import; Polars frames are immutable, so tests can share it
+_SAMPLE_DATA = pl.DataFrame(
+    {
+        "campaign_id": [1, 1, 1, 1, 1, 1, 1],
+        "report_day": [
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+            date(2024, 1, 8),
+            date(2024, 1, 9),
+            date(2024, 1, 15),
+            date(2024, 1, 16),
+            date(2024, 1, 22),
+        ],
+        "week_start": [
+            date(2024, 1, 1),
+            date(2024, 1, 1),
+            date(2024, 1, 8),
+            date(2024, 1, 8),
+            date(2024, 1, 15),
+            date(2024, 1, 15),
+            date(2024, 1, 22),
+        ],
+        "impressions": [1000, 1200, 2000, 2500, 3000, 3500, 8000],
+        "clicks": [50, 60, 100, 125, 150, 175, 400],
+        "spend": [100.0, 120.0, 200.0, 250.0, 300.0, 350.0, 800.0],
+        "ctr": [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05],
+        "cpm": [100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
+        "domain": ["a.com", "b.com", "a.com", "b.com", "a.com", "b.com", "a.com"],
+        "platform_device_type": [
+            "Mobile",
+            "Desktop",
+            "Mobile",
+            "Desktop",
+            "Mobile",
+            "Desktop",
+            "Mobile",
+        ],
+        "is_weekend": [False, False, False, False, False, False, False],
+        "campaign_end": [date(2024, 1, 31)] * 7,
+        "video_complete_pct": [0.80, 0.85, 0.82, 0.88, 0.81, 0.87, 0.90],
+        "video_completes": [800, 1020, 1640, 2200, 2430, 3045, 7200],
+        "viewability_pct": [0.99, 0.98, 0.99, 0.97, 0.99, 0.98, 0.99],
+        "viewable_impressions": [990, 1176, 1980, 2425, 2970, 3430, 7920],
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_df(tmp_path_factory: pytest.TempPathFactory) -> pl.DataFrame:
+    """Minimal test DataFrame, shared across the session.
 
+    Round-tripped through a session parquet file so tests see the same
+    Arrow-backed frame the ingestion cache produces.
+    """
+    path = tmp_path_factory.mktemp("fixtures") / "sample_domain.parquet"
+    _SAMPLE_DATA.write_parquet(path, compression="lz4")
+    return pl.read_parquet(path)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def engine(sample_df: pl.DataFrame) -> AnalyticalEngine:
-    """Create an AnalyticalEngine with sample data."""
+    """Create an AnalyticalEngine with sample data (read-only, shared)."""
     return AnalyticalEngine(
         df=sample_df,
         campaign_goal=25000,
@@ -108,6 +121,13 @@ class TestTemporalStats:
         week1 = next(w for w in result.weekly_totals if w.week_start == date(2024, 1, 1))
         assert week1.impressions == 2200
 
+    def test_weekly_soa_matches_totals(self, engine: AnalyticalEngine) -> None:
+        """Column arrays should round-trip to the same WeeklyStats list."""
+        result = engine.get_temporal_stats()
+        assert result.weekly_soa is not None
+        assert len(result.weekly_soa) == 4
+        assert result.weekly_soa.as_aos() == result.weekly_totals
+
     def test_detects_spike(self, engine: AnalyticalEngine) -> None:
         """Should detect WoW spikes above threshold."""
         result = engine.get_temporal_stats()
@@ -117,6 +137,28 @@ class TestTemporalStats:
         spikes = [s for s in result.spikes if s.metric_name == "total_impressions"]
         assert len(spikes) >= 1
 
+    def test_zero_delivery_weeks_are_not_spikes(self) -> None:
+        """0/0 week-over-week changes (NaN) should not be flagged as spikes."""
+        zero_weeks = pl.col("week_start").is_in([date(2024, 1, 8), date(2024, 1, 15)])
+        df = _SAMPLE_DATA.with_columns(
+            pl.when(zero_weeks).then(0).otherwise(pl.col(c)).alias(c)
+            for c in ("impressions", "clicks")
+        )
+        result = AnalyticalEngine(df=df).get_temporal_stats()
+        nan_changes = [w for w in result.wow_changes if w.pct_change != w.pct_change]
+        assert nan_changes
+        assert not any(w.is_spike for w in nan_changes)
+        assert all(s.pct_change == s.pct_change for s in result.spikes)
+
+    def test_wow_table_rows(self, engine: AnalyticalEngine) -> None:
+        """Spike rows should match the flagged WoW changes, by index or slice."""
+        result = engine.get_temporal_stats()
+        assert type(result.wow_changes) is type(result.spikes)
+        flagged = [w for w in result.wow_changes if w.is_spike]
+        assert list(result.spikes) == flagged
+        assert result.spikes[0] == flagged[0]
+        assert list(result.spikes[:2]) == flagged[:2]
+
 
 class TestEfficiencyMetrics:
     """Tests for get_efficiency_metrics()."""
@@ -160,6 +202,13 @@ class TestAnomalyDetection:
         result = engine.detect_anomalies()
         assert result.total_weeks_analyzed == 4
 
+    def test_bulk_matches_single(self, engine: AnalyticalEngine) -> None:
+        """Bulk detection should return the per-metric reports."""
+        result = engine.detect_anomalies_bulk(["ctr", "impressions", "clicks"])
+        assert list(result) == ["ctr", "impressions", "clicks"]
+        for metric, report in result.items():
+            assert report is engine.detect_anomalies(metric)
+
 
 class TestNormalizedDf:
     """Tests for get_normalized_df()."""
@@ -218,6 +267,32 @@ class TestDeliveryPattern:
         assert isinstance(result.is_back_loaded, bool)
 
 
+class TestDetectTrend:
+    """Tests for detect_trend()."""
+
+    def test_increasing_series(self) -> None:
+        """Monotonic growth should be reported as increasing."""
+        assert detect_trend([1.0, 2.0, 3.5, 4.0, 5.5, 7.0]) == "increasing"
+
+    def test_alternating_series_is_stable(self) -> None:
+        """Series without a dominant direction should be reported as stable."""
+        assert detect_trend([5.0, 1.0, 5.0, 1.0, 5.0, 1.0, 5.0]) == "stable"
+
+    def test_constant_series_is_stable(self) -> None:
+        """A flat series has no trend."""
+        assert detect_trend([3.0] * 10) == "stable"
+
+    def test_noisy_increasing_series(self) -> None:
+        """A strong slope should be found even when noise flips many steps."""
+        t = np.arange(60)
+        values = 10 * t + np.random.default_rng(0).normal(0, 50, 60)
+        assert detect_trend(values) == "increasing"
+
+    def test_nan_series_is_stable(self) -> None:
+        """NaN input should not raise."""
+        assert detect_trend([1.0, float("nan"), 3.0, 4.0]) == "stable"
+
+
 class TestStatPack:
     """Tests for get_stat_pack()."""
 
@@ -233,12 +308,43 @@ class TestStatPack:
         assert isinstance(json_str, str)
         assert len(json_str) > 0
 
+    def test_stat_pack_compact_json(self, engine: AnalyticalEngine) -> None:
+        """Streamed compact JSON should decode to the same content."""
+        result = engine.get_stat_pack()
+        assert json.loads(result.to_json(indent=None)) == json.loads(result.to_json())
+
     def test_stat_pack_aggregates(self, engine: AnalyticalEngine) -> None:
         """Should contain correct aggregates."""
         result = engine.get_stat_pack()
         assert result.total_impressions == 21200
         assert result.total_clicks == 1060
 
+    def test_stat_pack_equality(self, engine: AnalyticalEngine) -> None:
+        """Comparing stat packs should not hit DataFrame truthiness."""
+        result = engine.get_stat_pack()
+        rankings = result.domain_rankings.clone()
+        assert result == dataclasses.replace(result, domain_rankings=rankings)
+
+    def test_compute_all_matches_getters(self, engine: AnalyticalEngine) -> None:
+        """compute_all() should return the same (memoized) results as the getters."""
+        results = engine.compute_all()
+        assert isinstance(results, AnalysisResults)
+        assert results.stat_pack is engine.get_stat_pack()
+        assert results.temporal is engine.get_temporal_stats()
+        assert results.anomalies is engine.detect_anomalies("ctr")
+
+    def test_thresholds_are_frozen(self, engine: AnalyticalEngine) -> None:
+        """Memoized results rely on the thresholds never changing."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            engine.spike_threshold = 0.1  # type: ignore[misc]
+
+    def test_insights_triggers_without_goal(self, sample_df: pl.DataFrame) -> None:
+        """No goal should mean no goal-completion trigger."""
+        result = AnalyticalEngine(df=sample_df, campaign_goal=None).get_stat_pack()
+        assert result.completion_pct is None
+        types = {t["type"] for t in result.get_insights_triggers()}
+        assert not types & {"delivery_success", "delivery_warning"}
+
 
 # =============================================================================
 # INTEGRATION TESTS
@@ -248,25 +354,10 @@ class TestStatPack:
 class TestIntegration:
     """Integration tests with real data."""
 
-    @pytest.fixture
-    def real_df(self) -> pl.DataFrame | None:
-        """Load real Domain Report if available."""
-        data_path = Path("Files/Input/Domain Report.xlsx")
-        schema_path = Path("src/config/schema_registry.yaml")
-
-        if not data_path.exists() or not schema_path.exists():
-            pytest.skip("Test data not available")
-
-        pipeline = DataIngestionPipeline(schema_path)
-        return pipeline.ingest(data_path, validate=True)
-
-    def test_full_pipeline(self, real_df: pl.DataFrame | None) -> None:
+    def test_full_pipeline(self, domain_df: pl.DataFrame) -> None:
         """Test full analytics pipeline with real data."""
-        if real_df is None:
-            pytest.skip("No real data")
-
         engine = AnalyticalEngine(
-            df=real_df,
+            df=domain_df,
             campaign_goal=10_000_000,
         )
 
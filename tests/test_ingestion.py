@@ -1,23 +1,256 @@
-from pathlib import Path
+"""Tests for the ingestion module."""
+
+import os
 import sys
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.exceptions import ColumnValidationError
+from src.ingestion import DataIngestionPipeline, validate_schema
+from src.ingestion.validator import SCHEMA_FIELDS
+
+_SAMPLE_VALUES = {str: "x", int: 1, float: 1.0, date: date(2024, 1, 1), bool: False}
+
+
+def _valid_frame(schema_name: str = "domain_report", rows: int = 3) -> pl.DataFrame:
+    """Frame with one correctly typed column per model field."""
+    return pl.DataFrame(
+        {
+            name: [_SAMPLE_VALUES[py_type]] * rows
+            for name, py_type, _, _ in SCHEMA_FIELDS[schema_name]
+        }
+    )
+
+
+def _write_source(
+    path: Path, pipeline: DataIngestionPipeline, **values: object
+) -> Path:
+    """Write a raw domain report (source column names) as parquet.
+
+    Columns default to a valid value for their field; ``values`` overrides
+    them by internal name. The file's mtime is bumped past any previous
+    version so rewrites always count as a new file version.
+    """
+    types = {name: py_type for name, py_type, _, _ in SCHEMA_FIELDS["domain_report"]}
+    column_map = pipeline.schema["domain_report"]["column_map"]
+    pl.DataFrame(
+        {
+            raw: values.get(name, [_SAMPLE_VALUES[types[name]]] * 3)
+            for name, raw in column_map.items()
+        }
+    ).write_parquet(path)
+    mtime_ns = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+# =============================================================================
+# VALIDATE SCHEMA
+# =============================================================================
+
+
+class TestValidateSchema:
+    """Tests for validate_schema()."""
+
+    @pytest.mark.parametrize("schema_name", ["domain_report", "campaign_report"])
+    def test_valid_frame_passes(self, schema_name: str) -> None:
+        """Correctly typed frames should pass."""
+        validate_schema(_valid_frame(schema_name), schema_name)
+
+    def test_categorical_passes_for_str(self) -> None:
+        """Dictionary-encoded text columns should count as str."""
+        df = _valid_frame().with_columns(pl.col("day_of_week").cast(pl.Categorical))
+        validate_schema(df)
+
+    @pytest.mark.parametrize(
+        ("column", "value"),
+        [("impressions", "7"), ("campaign_id", "123"), ("clicks", 2.0)],
+    )
+    def test_wrong_dtype_rejected(self, column: str, value: object) -> None:
+        """Strings and floats should not pass int fields, even if they parse."""
+        df = _valid_frame().with_columns(pl.lit(value).alias(column))
+        with pytest.raises(ColumnValidationError) as exc_info:
+            validate_schema(df)
+        assert [e["column"] for e in exc_info.value.errors] == [column]
+
+    def test_all_null_optional_column_passes(self) -> None:
+        """An all-null column of another dtype holds only None values."""
+        df = _valid_frame().with_columns(pl.lit(None, pl.String).alias("flight_end"))
+        validate_schema(df)
+
+    def test_missing_required_column(self) -> None:
+        """A required field without a column should be reported."""
+        with pytest.raises(ColumnValidationError) as exc_info:
+            validate_schema(_valid_frame().drop("report_day"))
+        assert exc_info.value.errors == [
+            {"column": "report_day", "error": "missing column"}
+        ]
+
+    def test_nulls_in_required_column(self) -> None:
+        """Nulls in a required field should be counted."""
+        df = _valid_frame().with_columns(
+            pl.when(pl.int_range(pl.len()) == 0).then(pl.col("domain")).alias("domain")
+        )
+        with pytest.raises(ColumnValidationError) as exc_info:
+            validate_schema(df)
+        assert exc_info.value.errors == [{"column": "domain", "error": "2 null values"}]
+
+    def test_error_message_counts_columns(self) -> None:
+        """Column errors should not be reported as failed rows."""
+        with pytest.raises(ColumnValidationError, match=r"1 column\(s\) \(3 rows\)"):
+            validate_schema(_valid_frame().drop("report_day"))
+
+
+# =============================================================================
+# INGEST CACHE
+# =============================================================================
+
+
+@pytest.fixture
+def cached_pipeline(schema_path: Path, tmp_path: Path) -> DataIngestionPipeline:
+    """Pipeline with a test-private cache directory."""
+    return DataIngestionPipeline(schema_path, cache_dir=tmp_path / "cache")
+
+
+class TestIngestCache:
+    """Tests for the parquet cache of ingested frames."""
+
+    def test_disabled_without_cache_dir(
+        self, schema_path: Path, tmp_path: Path
+    ) -> None:
+        """No cache_dir should mean nothing is written."""
+        pipeline = DataIngestionPipeline(schema_path)
+        source = _write_source(tmp_path / "report.parquet", pipeline)
+        pipeline.ingest(source)
+        assert pipeline.cache_dir is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["report.parquet"]
+
+    def test_miss_then_hit(
+        self,
+        cached_pipeline: DataIngestionPipeline,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The first ingest should fill the cache; the second should read it."""
+        source = _write_source(tmp_path / "report.parquet", cached_pipeline)
+        first = cached_pipeline.ingest(source)
+        assert len(list(cached_pipeline.cache_dir.glob("*.parquet"))) == 1
+
+        def fail(*args: object) -> None:
+            raise AssertionError("cache miss")
+
+        monkeypatch.setattr(cached_pipeline, "_process", fail)
+        assert cached_pipeline.ingest(source).equals(first)
+
+    def test_source_change_invalidates(
+        self, cached_pipeline: DataIngestionPipeline, tmp_path: Path
+    ) -> None:
+        """Rewriting the source should be picked up, not served from cache."""
+        source = _write_source(tmp_path / "report.parquet", cached_pipeline)
+        assert cached_pipeline.ingest(source)["impressions"].to_list() == [1, 1, 1]
+
+        _write_source(source, cached_pipeline, impressions=[5, 6, 7])
+        assert cached_pipeline.ingest(source)["impressions"].to_list() == [5, 6, 7]
+        assert len(list(cached_pipeline.cache_dir.glob("*.parquet"))) == 2
+
+
+class TestCategoricalColumns:
+    """Tests for dictionary-encoded text columns."""
+
+    def test_categorical_keeps_blank_values(
+        self, cached_pipeline: DataIngestionPipeline, tmp_path: Path
+    ) -> None:
+        """Categorical columns are only re-encoded; blanks must not become nulls."""
+        source = _write_source(
+            tmp_path / "report.parquet", cached_pipeline, creative_size=["", "", ""]
+        )
+        df = cached_pipeline.ingest(source)
+        assert df.schema["creative_size"] == pl.Categorical
+        assert df["creative_size"].to_list() == ["", "", ""]
+
+
+class TestValidationMarker:
+    """Tests for skipping revalidation of unchanged files."""
+
+    @pytest.fixture
+    def validations(
+        self, cached_pipeline: DataIngestionPipeline, monkeypatch: pytest.MonkeyPatch
+    ) -> list[int]:
+        """Record the row count of every frame the pipeline validates."""
+        calls: list[int] = []
+        validate = cached_pipeline._validate
+
+        def spy(df: pl.DataFrame, schema_name: str) -> None:
+            calls.append(len(df))
+            validate(df, schema_name)
+
+        monkeypatch.setattr(cached_pipeline, "_validate", spy)
+        return calls
+
+    def test_marker_skips_revalidation(
+        self,
+        cached_pipeline: DataIngestionPipeline,
+        validations: list[int],
+        tmp_path: Path,
+    ) -> None:
+        """A file that passed validation should not be validated again."""
+        source = _write_source(tmp_path / "report.parquet", cached_pipeline)
+        cached_pipeline.ingest(source)
+        cached_pipeline.ingest(source)
+        assert validations == [3]
+        assert len(list(cached_pipeline.cache_dir.glob("*.validated"))) == 1
+
+    def test_failed_file_gets_no_marker(
+        self,
+        cached_pipeline: DataIngestionPipeline,
+        validations: list[int],
+        tmp_path: Path,
+    ) -> None:
+        """A file that failed validation should keep failing."""
+        source = _write_source(
+            tmp_path / "report.parquet", cached_pipeline, domain=[None, "a", "b"]
+        )
+        for _ in range(2):
+            with pytest.raises(ColumnValidationError):
+                cached_pipeline.ingest(source)
+        assert validations == [3, 3]
+        assert not list(cached_pipeline.cache_dir.glob("*.validated"))
+
+    def test_filtered_ingest_is_validated(
+        self,
+        cached_pipeline: DataIngestionPipeline,
+        validations: list[int],
+        tmp_path: Path,
+    ) -> None:
+        """A predicate should bypass the marker in both directions."""
+        source = _write_source(
+            tmp_path / "report.parquet", cached_pipeline, clicks=[1, 2, 3]
+        )
+        cached_pipeline.ingest(source, predicate=pl.col("clicks") > 1)
+        assert not list(cached_pipeline.cache_dir.glob("*.validated"))
+
+        cached_pipeline.ingest(source)
+        cached_pipeline.ingest(source, predicate=pl.col("clicks") > 1)
+        assert validations == [2, 3, 2]
 
-CURRENT_FILE = Path(__file__).resolve()
-sys.path.append(str(CURRENT_FILE.parent.parent))
 
-from src.ingestion.loader import DataIngestionPipeline
+# =============================================================================
+# INTEGRATION TESTS
+# =============================================================================
 
-pipeline = DataIngestionPipeline(Path('src/config/schema_registry.yaml'))
 
+def test_domain_report_validates(domain_df: pl.DataFrame) -> None:
+    """The real Domain Report should ingest and pass validation."""
+    assert len(domain_df) > 0
 
-try:
-    df = pipeline.ingest(Path('Files/Input/Domain Report.xlsx'), validate=True)
-    print('SUCCESS! All rows validated')
-    print(f'Rows: {len(df)}, Columns: {len(df.columns)}')
-    print()
-    print('=== Schema ===')
-    for name, dtype in df.schema.items():
-        print(f'  {name}: {dtype}')
-        
-except Exception as e:
-    print('VALIDATION FAILED!')
-    print(e)
\ No newline at end of file
+    lines = [
+        "SUCCESS! All rows validated",
+        f"Rows: {len(domain_df)}, Columns: {len(domain_df.columns)}",
+        "",
+        "=== Schema ===",
+        *(f"  {name}: {dtype}" for name, dtype in domain_df.schema.items()),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
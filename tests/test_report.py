@@ -1,13 +1,25 @@
-import json
+"""Report service smoke test against the real input reports."""
+
+import sys
 from pathlib import Path
+
+import orjson
+
 from src.services import ReportService
 
-service = ReportService()
-output = service.generate_report(
-    campaign_id=4512,
-    domain_report_path=Path('Files/Input/Domain Report.xlsx'),
-    campaign_report_path=Path('Files/Input/Campaign Report.xlsx')
-)
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def test_generate_report(
+    domain_report_path: Path, campaign_report_path: Path, cache_dir: Path
+) -> None:
+    """A report for the sample campaign should build and summarize."""
+    service = ReportService(cache_dir=cache_dir, cache_reports=False)
+    output = service.generate_report(
+        campaign_id=4512,
+        domain_report_path=domain_report_path,
+        campaign_report_path=campaign_report_path,
+    )
 
-summary = service.generate_summary_dict(output)
-print(json.dumps(summary, indent=2))
\ No newline at end of file
+    summary = service.generate_summary_dict(output)
+    sys.stdout.write(orjson.dumps(summary, option=_JSON_OPTS).decode() + "\n")